@@ -16,7 +16,7 @@ if __name__ == "__main__":
 from langchain.agents import create_agent
 from langchain_openai import ChatOpenAI
 
-from src.rag.retrieval_and_generation import retrieve_tool
+from src.rag.retrieval_and_generation import retrieve_tool, retrieve_batch_tool
 from src.config import get_openai_api_key, DEFAULT_LLM_MODEL, ConfigError
 from src.prompts import FINANCIAL_ASSISTANT_PROMPT
 
@@ -44,7 +44,7 @@ def create_finance_assistant():
     # Create agent with tools
     agent = create_agent(
         model=llm,
-        tools=[retrieve_tool],
+        tools=[retrieve_tool, retrieve_batch_tool],
         system_prompt=FINANCIAL_ASSISTANT_PROMPT
     )
 
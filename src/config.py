@@ -6,18 +6,50 @@ Follows DRY principle by providing single source of truth for all configuration.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Project root (the directory containing src/)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Environment values read so far; cleared by invalidate_env_cache. Unset keys
+# are not cached, so a variable exported later is still picked up.
+_ENV_CACHE: Dict[str, str] = {}
+
 
 class ConfigError(Exception):
     """Raised when configuration is missing or invalid."""
     pass
 
 
+def _getenv(key: str) -> Optional[str]:
+    """Read an environment variable, caching it for later calls once it is set."""
+    value = _ENV_CACHE.get(key)
+    if value is None:
+        value = os.environ.get(key)
+        if value is not None:
+            _ENV_CACHE[key] = value
+    return value
+
+
+def invalidate_env_cache(key: Optional[str] = None) -> None:
+    """
+    Forget cached environment values so the next read sees os.environ.
+
+    Call this after changing environment variables at runtime (e.g. in tests).
+
+    Args:
+        key: Variable to forget, or None to clear the whole cache
+    """
+    if key is None:
+        _ENV_CACHE.clear()
+    else:
+        _ENV_CACHE.pop(key, None)
+
+
 def get_openai_api_key() -> str:
     """
     Get OpenAI API key from environment variables.
@@ -28,7 +60,7 @@ def get_openai_api_key() -> str:
     Raises:
         ConfigError: If OPENAI_API_KEY environment variable is not set
     """
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = _getenv("OPENAI_API_KEY")
     if not api_key:
         raise ConfigError(
             "OPENAI_API_KEY environment variable is not set. "
@@ -49,7 +81,7 @@ def get_pinecone_api_key() -> str:
     Raises:
         ConfigError: If PINECONE_API_KEY environment variable is not set
     """
-    api_key = os.getenv("PINECONE_API_KEY")
+    api_key = _getenv("PINECONE_API_KEY")
     if not api_key:
         raise ConfigError(
             "PINECONE_API_KEY environment variable is not set. "
@@ -75,7 +107,9 @@ def get_config_value(key: str, default: Optional[str] = None, required: bool = F
     Raises:
         ConfigError: If required=True and key is not found
     """
-    value = os.getenv(key, default)
+    value = _getenv(key)
+    if value is None:
+        value = default
 
     if required and value is None:
         raise ConfigError(
@@ -92,7 +126,11 @@ DEFAULT_CHUNK_SIZE = int(get_config_value("CHUNK_SIZE", default="300"))
 DEFAULT_CHUNK_OVERLAP = int(get_config_value("CHUNK_OVERLAP", default="100"))
 DEFAULT_LLM_MODEL = get_config_value("LLM_MODEL", default="gpt-4o-mini")
 DEFAULT_EMBEDDING_MODEL = get_config_value("EMBEDDING_MODEL", default="text-embedding-3-small")
+EMBEDDING_BACKEND = get_config_value("EMBEDDING_BACKEND", default="openai")
+LOCAL_EMBEDDING_MODEL = get_config_value("LOCAL_EMBEDDING_MODEL", default="BAAI/bge-small-en-v1.5")
 DEFAULT_RETRIEVAL_K = int(get_config_value("RETRIEVAL_K", default="5"))
+RAG_CACHE_DIR = get_config_value("RAG_CACHE_DIR", default=os.path.join(PROJECT_ROOT, ".rag_cache"))
+ONNX_CACHE_DIR = get_config_value("ONNX_CACHE_DIR", default=os.path.join(PROJECT_ROOT, ".onnx_models"))
 
 # Context window management configuration
 MAX_CONTEXT_MESSAGES = int(get_config_value("MAX_CONTEXT_MESSAGES", default="10"))
@@ -129,6 +167,7 @@ if __name__ == "__main__":
         print(f"✓ CHUNK_OVERLAP: {DEFAULT_CHUNK_OVERLAP}")
         print(f"✓ LLM_MODEL: {DEFAULT_LLM_MODEL}")
         print(f"✓ EMBEDDING_MODEL: {DEFAULT_EMBEDDING_MODEL}")
+        print(f"✓ EMBEDDING_BACKEND: {EMBEDDING_BACKEND}")
         print(f"✓ RETRIEVAL_K: {DEFAULT_RETRIEVAL_K}")
 
         openai_key = get_openai_api_key()
@@ -14,12 +14,14 @@ Components:
 
 from .types import (
     AgentType,
+    RouteKind,
+    ExecMode,
     RouterDecision,
     SupervisorDecision,
     FinancialAssistantState,
     ExecutionPlan,
 )
-from .router import fast_route, DIRECT_ROUTE_THRESHOLD
+from .router import fast_route, fast_route_batch, DIRECT_ROUTE_THRESHOLD
 from .supervisor import supervisor_route, create_supervisor_agent
 from .graph import (
     create_financial_assistant_graph,
@@ -32,12 +34,15 @@ from .graph import (
 __all__ = [
     # Types
     "AgentType",
+    "RouteKind",
+    "ExecMode",
     "RouterDecision",
     "SupervisorDecision",
     "FinancialAssistantState",
     "ExecutionPlan",
     # Router
     "fast_route",
+    "fast_route_batch",
     "DIRECT_ROUTE_THRESHOLD",
     # Supervisor
     "supervisor_route",
@@ -10,7 +10,7 @@ from langchain_core.messages import HumanMessage, AIMessage
 
 from .router import fast_route
 from .supervisor import supervisor_route
-from .types import FinancialAssistantState, AgentType, ExecutionPlan
+from .types import FinancialAssistantState, AgentType, ExecutionPlan, RouteKind, ExecMode
 from src.utils.context_manager import trim_for_agent, get_context_summary
 
 # Import all specialized agents
@@ -99,7 +99,7 @@ def supervisor_node(state: FinancialAssistantState) -> Dict[str, Any]:
 
     # Initialize execution plan for multi-agent scenarios
     execution_plan = None
-    if supervisor_decision.execution_mode in ["sequential", "parallel"]:
+    if supervisor_decision.execution_mode in (ExecMode.SEQUENTIAL, ExecMode.PARALLEL):
         # Create execution plan (sequential only for now)
         agents_to_execute = [supervisor_decision.primary_agent] + supervisor_decision.secondary_agents
         execution_plan = {
@@ -393,7 +393,7 @@ def route_after_fast_router(state: FinancialAssistantState) -> str:
     """
     router_decision = state.get("router_decision")
 
-    if not router_decision or router_decision.route == "supervisor":
+    if not router_decision or router_decision.route == RouteKind.SUPERVISOR:
         return "supervisor"
 
     # Direct routing to specific agent
@@ -421,7 +421,7 @@ def route_after_supervisor(state: FinancialAssistantState) -> str:
         return "education_agent"
 
     # Check execution mode
-    if supervisor_decision.execution_mode == "single":
+    if supervisor_decision.execution_mode == ExecMode.SINGLE:
         # Single agent - route directly
         agent_type = supervisor_decision.primary_agent
         return f"{agent_type.value}_agent"
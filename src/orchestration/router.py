@@ -7,7 +7,7 @@ Uses pattern matching and keyword scoring for fast, deterministic routing.
 
 import re
 from typing import Optional, Dict, List, Tuple
-from .types import RouterDecision, AgentType
+from .types import RouterDecision, AgentType, RouteKind
 
 
 # Confidence threshold for direct routing (0.85 = 85% confidence)
@@ -96,6 +96,12 @@ EXACT_PATTERNS: Dict[AgentType, List[str]] = {
     ],
 }
 
+# EXACT_PATTERNS compiled once at import, keeping the source for reasoning text
+_COMPILED_PATTERNS: Dict[AgentType, List[Tuple[str, "re.Pattern[str]"]]] = {
+    agent_type: [(pattern, re.compile(pattern)) for pattern in patterns]
+    for agent_type, patterns in EXACT_PATTERNS.items()
+}
+
 
 # Keyword weights for scoring (when patterns don't match)
 # Format: {keyword: weight} where higher weight = stronger signal
@@ -223,6 +229,35 @@ def fast_route(
     )
 
 
+def fast_route_batch(
+    questions: List[str],
+    contexts: Optional[List[Optional[Dict]]] = None
+) -> List[RouterDecision]:
+    """
+    Route several questions in one call.
+
+    Patterns are compiled at import, so the batch only pays for matching
+    and scoring each question.
+
+    Args:
+        questions: User questions to route
+        contexts: Optional per-question contexts, aligned with questions
+
+    Returns:
+        One RouterDecision per question, in input order
+
+    Raises:
+        ValueError: If contexts is given with a different length than questions
+    """
+    if contexts is None:
+        contexts = [None] * len(questions)
+    elif len(contexts) != len(questions):
+        raise ValueError("contexts must have one entry per question")
+
+    route = fast_route
+    return [route(question, context) for question, context in zip(questions, contexts)]
+
+
 def _try_pattern_matching(
     question_lower: str,
     context: Optional[Dict]
@@ -232,9 +267,9 @@ def _try_pattern_matching(
 
     Returns RouterDecision if confident match found, None otherwise.
     """
-    for agent_type, patterns in EXACT_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, question_lower):
+    for agent_type, patterns in _COMPILED_PATTERNS.items():
+        for pattern, compiled in patterns:
+            if compiled.search(question_lower):
                 confidence = 0.95  # Very high confidence for exact patterns
 
                 # Apply context adjustments
@@ -245,7 +280,7 @@ def _try_pattern_matching(
 
                 if confidence >= DIRECT_ROUTE_THRESHOLD:
                     return RouterDecision(
-                        route="direct",
+                        route=RouteKind.DIRECT,
                         agent=agent_type,
                         confidence=confidence,
                         reasoning=f"Exact pattern match: '{pattern}'",
@@ -286,7 +321,7 @@ def _try_keyword_scoring(
     # Only route directly if confidence is high enough
     if confidence >= DIRECT_ROUTE_THRESHOLD:
         return RouterDecision(
-            route="direct",
+            route=RouteKind.DIRECT,
             agent=winner,
             confidence=confidence,
             reasoning=f"Keyword score: {winner_score:.2f} (margin: {winner_score - runner_up_score:.2f})",
@@ -423,7 +458,7 @@ def _fallback_to_supervisor(
         RouterDecision with route="supervisor"
     """
     return RouterDecision(
-        route="supervisor",
+        route=RouteKind.SUPERVISOR,
         agent=None,
         confidence=0.0,
         reasoning=reason,
@@ -459,8 +494,8 @@ def analyze_routing(question: str, context: Optional[Dict] = None) -> Dict:
 
     # Find all pattern matches
     pattern_matches = {}
-    for agent_type, patterns in EXACT_PATTERNS.items():
-        matches = [p for p in patterns if re.search(p, question_lower)]
+    for agent_type, patterns in _COMPILED_PATTERNS.items():
+        matches = [p for p, compiled in patterns if compiled.search(question_lower)]
         if matches:
             pattern_matches[agent_type.value] = matches
 
@@ -13,7 +13,7 @@ from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.config import get_openai_api_key, DEFAULT_LLM_MODEL
 from src.prompts import get_prompt
-from .types import SupervisorDecision, AgentType
+from .types import SupervisorDecision, AgentType, ExecMode
 
 
 def create_supervisor_agent():
@@ -228,16 +228,17 @@ def _parse_supervisor_response(response: str, question: str) -> SupervisorDecisi
                     continue  # Skip invalid agent names
 
             # Extract execution mode
-            execution_mode = data.get("execution_mode", "single")
-            if execution_mode not in ["single", "sequential", "parallel"]:
-                execution_mode = "single"
+            try:
+                execution_mode = ExecMode(data.get("execution_mode", ExecMode.SINGLE))
+            except ValueError:
+                execution_mode = ExecMode.SINGLE
 
             # Extract reasoning
             reasoning = data.get("reasoning", "Supervisor routing decision")
 
             # Build workflow steps if sequential
             workflow_steps = []
-            if execution_mode == "sequential" and secondary_agents:
+            if execution_mode == ExecMode.SEQUENTIAL and secondary_agents:
                 agents = [primary_agent] + secondary_agents
                 workflow_steps = [
                     f"{i+1}. Call {agent.value} agent"
@@ -294,7 +295,7 @@ def _fallback_decision(question: str, error_msg: str) -> SupervisorDecision:
     return SupervisorDecision(
         primary_agent=agent,
         secondary_agents=[],
-        execution_mode="single",
+        execution_mode=ExecMode.SINGLE,
         reasoning=f"Fallback routing ({error_msg}): Heuristic matched '{agent.value}'",
         workflow_steps=[]
     )
@@ -4,8 +4,8 @@ Type definitions for multi-agent routing and orchestration.
 Defines enums, models, and state schemas used across the orchestration layer.
 """
 
-from enum import Enum
-from typing import TypedDict, List, Dict, Any, Literal, Optional, Annotated
+from enum import Enum, StrEnum
+from typing import TypedDict, List, Dict, Any, Optional, Annotated
 from pydantic import BaseModel, Field
 from langgraph.graph import add_messages
 
@@ -20,6 +20,21 @@ class AgentType(Enum):
     NEWS = "news"                     # news_synthesizer.py - Investment research
 
 
+class RouteKind(StrEnum):
+    """Where the fast router sends a question."""
+
+    DIRECT = "direct"          # Straight to a specialized agent
+    SUPERVISOR = "supervisor"  # Defer to the LLM supervisor
+
+
+class ExecMode(StrEnum):
+    """How the supervisor executes the selected agents."""
+
+    SINGLE = "single"
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+
+
 class RouterDecision(BaseModel):
     """
     Fast router decision output.
@@ -27,7 +42,7 @@ class RouterDecision(BaseModel):
     Represents the decision made by the rule-based fast router.
     """
 
-    route: Literal["direct", "supervisor"] = Field(
+    route: RouteKind = Field(
         description="Whether to route directly to an agent or use supervisor"
     )
     agent: Optional[AgentType] = Field(
@@ -61,8 +76,8 @@ class SupervisorDecision(BaseModel):
         default_factory=list,
         description="Additional agents to call (for multi-agent scenarios)"
     )
-    execution_mode: Literal["single", "sequential", "parallel"] = Field(
-        default="single",
+    execution_mode: ExecMode = Field(
+        default=ExecMode.SINGLE,
         description="How to execute multiple agents: single, sequential, or parallel"
     )
     reasoning: str = Field(
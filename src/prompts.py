@@ -5,6 +5,10 @@ Centralized management of all system prompts and prompt templates.
 Follows clean code principles by keeping prompts in a single maintainable location.
 """
 
+import functools
+import string
+from typing import Optional, Tuple
+
 # Financial Education Assistant Prompt
 FINANCIAL_ASSISTANT_PROMPT = """
 You are a knowledgeable financial education assistant. Your role is to help users understand
@@ -386,13 +390,23 @@ Tool to retrieve relevant documents from the financial education knowledge base
 Use this tool to find information about personal finance topics, investment strategies, budgeting,
 debt management, and other financial education subjects.
 """
+
+RETRIEVE_BATCH_TOOL_DESCRIPTION = """
+Tool to retrieve relevant documents from the financial education knowledge base for several queries at once.
+Pass the queries as a JSON list of strings, e.g. ["What is an index fund?", "How do bonds work?"].
+Prefer this over calling retrieve_tool repeatedly when a question needs multiple lookups.
+"""
  
 
 
+@functools.lru_cache(maxsize=None)
 def get_prompt(prompt_name: str) -> str:
     """
     Get a prompt by name.
 
+    Results are cached; prompts are immutable strings, so every call for
+    the same name returns the same object.
+
     Args:
         prompt_name: Name of the prompt to retrieve
 
@@ -420,6 +434,29 @@ def get_prompt(prompt_name: str) -> str:
     return prompts[prompt_name]
 
 
+_FORMATTER = string.Formatter()
+
+# (literal, field_name, format_spec, conversion) as produced by Formatter.parse
+_Segment = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_template(template: str) -> Optional[Tuple[_Segment, ...]]:
+    """
+    Parse a template into (literal, field_name, format_spec, conversion) segments.
+
+    Returns None for templates the fast path does not handle (positional
+    fields or nested format specs), which are formatted with str.format.
+    """
+    segments = tuple(_FORMATTER.parse(template))
+    for _, field_name, format_spec, _ in segments:
+        if field_name is not None and (
+            field_name == "" or field_name[0].isdigit() or "{" in format_spec
+        ):
+            return None
+    return segments
+
+
 def format_prompt(template: str, **kwargs) -> str:
     """
     Format a prompt template with provided variables.
@@ -435,8 +472,25 @@ def format_prompt(template: str, **kwargs) -> str:
         >>> template = "Hello {name}, your balance is {balance}"
         >>> format_prompt(template, name="John", balance="$1000")
         'Hello John, your balance is $1000'
+
+    Raises:
+        KeyError: If a placeholder has no matching keyword argument
     """
-    return template.format(**kwargs)
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format(**kwargs)
+
+    parts = []
+    for literal, field_name, format_spec, conversion in segments:
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        value, _ = _FORMATTER.get_field(field_name, (), kwargs)
+        if conversion:
+            value = _FORMATTER.convert_field(value, conversion)
+        parts.append(format(value, format_spec))
+    return "".join(parts)
 
 
 # Prompt templates with variables
@@ -6,7 +6,7 @@ for financial education content using Pinecone vector database.
 
 Key Features:
 - Automatic duplicate prevention: Checks if embeddings already exist
-- Supports multiple document formats via PyPDFDirectoryLoader
+- Parallel, memory-mapped PDF parsing with pypdf
 - Efficient chunking with RecursiveCharacterTextSplitter
 - OpenAI embeddings for semantic search
 - Pinecone vector store for fast retrieval
@@ -22,40 +22,92 @@ Usage:
     # Force re-indexing if documents changed
     vectorstore = setup_finance_rag("./financial_docs", force_reindex=True)
 
+    # Or only embed chunks that are not in the index yet
+    vectorstore = setup_finance_rag("./financial_docs", incremental=True)
+
     # Get existing vector store without re-indexing
     from src.rag.ingestion import get_vectorstore
     vectorstore = get_vectorstore()
 """
 
+import functools
+import hashlib
+import itertools
+import mmap
+import multiprocessing
+import pickle
+import queue
+import re
 import sys
+import threading
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 # Add project root to Python path for direct execution
 if __name__ == "__main__":
     project_root = Path(__file__).parent.parent.parent
     sys.path.insert(0, str(project_root))
 
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFDirectoryLoader
 from pinecone import Pinecone, ServerlessSpec
 from langchain_openai import OpenAIEmbeddings
 from langchain_pinecone import PineconeVectorStore
+from pypdf import PdfReader
 
 from src.config import (
     get_openai_api_key,
     get_pinecone_api_key,
     INDEX_NAME,
     DEFAULT_EMBEDDING_MODEL,
+    EMBEDDING_BACKEND,
     DEFAULT_CHUNK_SIZE,
-    DEFAULT_CHUNK_OVERLAP
+    DEFAULT_CHUNK_OVERLAP,
+    RAG_CACHE_DIR
 )
 
-# Module-level cache
-_pinecone_client: Optional[Pinecone] = None
-_openai_embeddings: Optional[OpenAIEmbeddings] = None
+# Embedding batch limits: texts per embed_documents call and an approximate
+# token budget per request (1 token ≈ 4 characters) to respect OpenAI limits
+EMBED_BATCH_SIZE = 96
+EMBED_MAX_TOKENS = 250_000
+
+# Parallel Pinecone upsert: concurrent HTTP connections, vectors per upsert
+# request (Pinecone's recommended bulk-load size), and vectors upserted
+# before the in-flight requests are awaited
+PINECONE_POOL_THREADS = 30
+UPSERT_BATCH_SIZE = 100
+DOCUMENT_CHUNK_SIZE = 1000
+
+# Items buffered between ingestion pipeline stages (parse → chunk → embed → upsert),
+# and how often (seconds) a blocked stage checks whether its consumer stopped
+PIPELINE_QUEUE_SIZE = 4
+PIPELINE_POLL_INTERVAL = 0.1
+
+# IDs per index.fetch request when probing for already-stored chunks
+FETCH_BATCH_SIZE = 200
+
+# Stored vector IDs sampled to check the index uses content-hash IDs
+ID_SAMPLE_SIZE = 20
+CHUNK_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+# Pages with less extracted text than this are treated as scanned images
+MIN_PAGE_TEXT_CHARS = 50
+
+# PDFs picked up by the loader (recursive, skipping hidden files)
+PDF_GLOB = "**/[!.]*.pdf"
 
+# Version of the chunking logic, part of the chunk cache key; bump it whenever
+# parsing, splitting or regularizing changes so stale pickles are not reused
+CHUNK_CACHE_VERSION = 1
 
+# Vector size of OpenAI text-embedding-3-small
+OPENAI_EMBEDDING_DIMENSION = 1536
+
+
+@functools.cache
 def _get_pinecone_client() -> Pinecone:
     """
     Get or initialize the Pinecone client with proper error handling.
@@ -66,16 +118,10 @@ def _get_pinecone_client() -> Pinecone:
     Raises:
         ConfigError: If PINECONE_API_KEY environment variable is not set
     """
-    global _pinecone_client
-
-    if _pinecone_client is not None:
-        return _pinecone_client
-
-    api_key = get_pinecone_api_key()
-    _pinecone_client = Pinecone(api_key=api_key)
-    return _pinecone_client
+    return Pinecone(api_key=get_pinecone_api_key(), pool_threads=PINECONE_POOL_THREADS)
 
 
+@functools.cache
 def _get_openai_embeddings() -> OpenAIEmbeddings:
     """
     Get OpenAI embeddings instance with proper error handling.
@@ -86,52 +132,650 @@ def _get_openai_embeddings() -> OpenAIEmbeddings:
     Raises:
         ConfigError: If OPENAI_API_KEY environment variable is not set
     """
-    global _openai_embeddings
+    return OpenAIEmbeddings(
+        model=DEFAULT_EMBEDDING_MODEL,
+        openai_api_key=get_openai_api_key()
+    )
 
-    if _openai_embeddings is not None:
-        return _openai_embeddings
 
-    api_key = get_openai_api_key()
-    _openai_embeddings = OpenAIEmbeddings(
-        model=DEFAULT_EMBEDDING_MODEL,
-        openai_api_key=api_key
+@functools.cache
+def _get_local_embeddings() -> Embeddings:
+    """
+    Get the local INT8 ONNX embeddings instance.
+
+    Returns:
+        Embeddings: Initialized LocalONNXEmbeddings instance
+
+    Raises:
+        ImportError: If optimum[onnxruntime] is not installed
+    """
+    from .local_embeddings import LocalONNXEmbeddings
+    return LocalONNXEmbeddings()
+
+
+def _get_embeddings() -> Embeddings:
+    """
+    Get the embeddings instance for the configured EMBEDDING_BACKEND.
+
+    Returns:
+        Embeddings: OpenAI embeddings, or a local INT8 ONNX model when
+                    EMBEDDING_BACKEND is "onnx"
+
+    Raises:
+        ConfigError: If OPENAI_API_KEY is not set (openai backend)
+        ImportError: If optimum[onnxruntime] is not installed (onnx backend)
+    """
+    if EMBEDDING_BACKEND == "onnx":
+        return _get_local_embeddings()
+    return _get_openai_embeddings()
+
+
+def _index_exists(pc: Pinecone) -> bool:
+    """
+    Check whether INDEX_NAME exists with a single list_indexes call.
+
+    Args:
+        pc: Pinecone client
+
+    Returns:
+        True if the index exists
+    """
+    indexes = pc.list_indexes()
+    return any(idx.name == INDEX_NAME for idx in indexes)
+
+
+def _index_state(
+    pc: Pinecone,
+    pool_threads: int = PINECONE_POOL_THREADS
+) -> Tuple[Optional[object], int, Optional[int]]:
+    """
+    Look up INDEX_NAME, its vector count and its vector dimension.
+
+    Args:
+        pc: Pinecone client
+        pool_threads: Number of concurrent upsert requests for the index handle
+
+    Returns:
+        (index handle, total vector count, dimension), or (None, 0, None) if
+        the index does not exist
+    """
+    if not _index_exists(pc):
+        return None, 0, None
+    index = pc.Index(INDEX_NAME, pool_threads=pool_threads)
+    stats = index.describe_index_stats()
+    return index, stats.get('total_vector_count', 0), stats.get('dimension')
+
+
+def _embedding_dimension(embeddings: Embeddings) -> int:
+    """Size of the vectors produced by embeddings (OpenAI models have no dimension attribute)."""
+    return getattr(embeddings, "dimension", OPENAI_EMBEDDING_DIMENSION)
+
+
+def _check_dimension(embeddings: Embeddings, index_dimension: Optional[int]) -> None:
+    """
+    Make sure the embedding backend produces vectors the index can store.
+
+    Args:
+        embeddings: Embeddings instance for the configured EMBEDDING_BACKEND
+        index_dimension: Dimension of the existing index (None if unknown)
+
+    Raises:
+        ValueError: If the dimensions differ
+    """
+    dimension = _embedding_dimension(embeddings)
+    if index_dimension and index_dimension != dimension:
+        raise ValueError(
+            f"Index '{INDEX_NAME}' stores {index_dimension}-dimensional vectors, but "
+            f"EMBEDDING_BACKEND={EMBEDDING_BACKEND} produces {dimension}-dimensional vectors. "
+            "Use the backend the index was built with, or rebuild it with force_reindex=True."
+        )
+
+
+def _threaded(iterable: Iterable, maxsize: int = PIPELINE_QUEUE_SIZE) -> Iterator:
+    """
+    Run an iterable in a background thread and yield its items.
+
+    This is one stage of the ingestion pipeline: items pass through a bounded
+    queue, so the producer works at most maxsize items ahead of the consumer
+    and both run concurrently. An exception raised by the producer is
+    re-raised in the consumer once the queue is drained.
+
+    When the consumer stops early (the generator is closed or the consuming
+    loop raises), the producer stops at its next item and closes iterable,
+    so upstream stages and their worker pools shut down too.
+
+    Args:
+        iterable: Producer to run in the background
+        maxsize: Maximum items buffered between producer and consumer
+
+    Yields:
+        Items of iterable, in order
+    """
+    items: queue.Queue = queue.Queue(maxsize=maxsize)
+    errors: List[BaseException] = []
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        # Bounded waits, so a stopped consumer never leaves the producer blocked
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=PIPELINE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    break
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+            put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while (item := items.get()) is not None:
+            yield item
+    finally:
+        stopped.set()
+    if errors:
+        raise errors[0]
+
+
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    """Group items into lists of at most size elements."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _batched_ranges(
+    texts: List[str],
+    batch_size: int = EMBED_BATCH_SIZE,
+    max_tokens: int = EMBED_MAX_TOKENS
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split texts into contiguous (start, end) ranges for batched embedding.
+
+    A batch closes when it reaches batch_size texts or when adding the next
+    text would exceed max_tokens (estimated as len/4).
+
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum texts per batch
+        max_tokens: Approximate maximum tokens per batch
+
+    Yields:
+        (start, end) index ranges into texts
+    """
+    start = 0
+    tokens = 0
+    for i, text in enumerate(texts):
+        text_tokens = len(text) // 4 + 1
+        if i > start and (i - start >= batch_size or tokens + text_tokens > max_tokens):
+            yield start, i
+            start = i
+            tokens = 0
+        tokens += text_tokens
+    if start < len(texts):
+        yield start, len(texts)
+
+
+def _embed_texts(texts: List[str], embeddings: Embeddings) -> List[List[float]]:
+    """
+    Embed texts in length-sorted batches, returning vectors in input order.
+
+    Sorting by length keeps each embed_documents batch uniform in size, so
+    short chunks are not padded out to the longest chunk in the batch.
+
+    Args:
+        texts: Texts to embed
+        embeddings: Embeddings instance used for embed_documents
+
+    Returns:
+        One vector per text, aligned with texts
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    sorted_texts = [texts[i] for i in order]
+
+    vectors: List[Optional[List[float]]] = [None] * len(texts)
+    for start, end in _batched_ranges(sorted_texts):
+        batch_vectors = embeddings.embed_documents(sorted_texts[start:end])
+        for offset, values in enumerate(batch_vectors):
+            vectors[order[start + offset]] = values
+
+    return vectors
+
+
+def _chunk_id(text: str) -> str:
+    """Derive a stable vector ID from chunk content."""
+    return hashlib.sha1(text.encode()).hexdigest()[:32]
+
+
+def _uses_chunk_ids(index) -> bool:
+    """
+    Check whether the vectors in the index are stored under _chunk_id IDs.
+
+    Indexes built before content-hash IDs (e.g. with
+    PineconeVectorStore.from_documents) use random UUIDs, which no chunk
+    hash ever matches. Only a sample of ID_SAMPLE_SIZE IDs is listed.
+
+    Args:
+        index: Pinecone index handle
+
+    Returns:
+        True if every sampled ID looks like a content hash
+    """
+    response = index.list_paginated(limit=ID_SAMPLE_SIZE)
+    return all(CHUNK_ID_PATTERN.fullmatch(item.id) for item in response.vectors)
+
+
+def _existing_ids(index, ids: List[str]) -> set:
+    """
+    Find which vector IDs are already stored in the index.
+
+    Args:
+        index: Pinecone index handle
+        ids: Candidate vector IDs
+
+    Returns:
+        Set of IDs present in the index
+    """
+    existing = set()
+    for i in range(0, len(ids), FETCH_BATCH_SIZE):
+        response = index.fetch(ids=ids[i:i + FETCH_BATCH_SIZE])
+        existing.update(response.vectors.keys())
+    return existing
+
+
+def _embed_and_upsert(
+    index,
+    documents: Iterable[Document],
+    embeddings: Embeddings,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    skip_existing: bool = False
+) -> int:
+    """
+    Embed documents in explicit batches and upsert the vectors into Pinecone.
+
+    Embedding and upserting run as two pipeline stages: a background thread
+    embeds groups of EMBED_BATCH_SIZE documents while this thread buffers
+    the vectors and issues full upserts of batch_size (async_req=True).
+    In-flight requests are awaited every DOCUMENT_CHUNK_SIZE vectors. documents may be
+    a lazy iterable, so embedding starts before upstream chunking finishes;
+    a generator is closed by the embedding thread once it stops reading.
+
+    Vector IDs are derived from a hash of the chunk text, so re-ingesting
+    identical content overwrites rather than duplicates. With skip_existing,
+    IDs already in the index are fetched first and those chunks are not
+    embedded again.
+
+    Metadata is stored with the chunk text under "text", the key
+    PineconeVectorStore reads page content from at query time.
+
+    Args:
+        index: Pinecone index handle (created with pool_threads)
+        documents: LangChain Document objects to embed
+        embeddings: Embeddings instance used for embed_documents
+        batch_size: Vectors per upsert request
+        skip_existing: If True, only embed chunks whose IDs are not stored yet
+
+    Returns:
+        Number of vectors upserted
+    """
+    def embed_stage() -> Iterator[List[Tuple]]:
+        seen = set()
+        try:
+            for group in _batched(documents, EMBED_BATCH_SIZE):
+                # Drop chunks with duplicate content; they would map to the same ID
+                unique = {}
+                for doc in group:
+                    vector_id = _chunk_id(doc.page_content)
+                    if vector_id not in seen:
+                        seen.add(vector_id)
+                        unique[vector_id] = doc
+
+                if skip_existing and unique:
+                    for existing_id in _existing_ids(index, list(unique)):
+                        del unique[existing_id]
+                if not unique:
+                    continue
+
+                docs = list(unique.values())
+                values = _embed_texts([doc.page_content for doc in docs], embeddings)
+                yield [
+                    (vector_id, vector, {**doc.metadata, "text": doc.page_content})
+                    for vector_id, doc, vector in zip(unique, docs, values)
+                ]
+        finally:
+            # Close a lazy source from the thread iterating it; closing it
+            # from any other thread fails while it is mid-item
+            if hasattr(documents, "close"):
+                documents.close()
+
+    upserted = 0
+    in_flight = []
+    pending: List[Tuple] = []
+    with closing(_threaded(embed_stage())) as embedded:
+        for vectors in embedded:
+            # Buffer across embedding groups so every request carries a full batch
+            pending.extend(vectors)
+            while len(pending) >= batch_size:
+                in_flight.append(index.upsert(vectors=pending[:batch_size], async_req=True))
+                del pending[:batch_size]
+                upserted += batch_size
+
+                if len(in_flight) * batch_size >= DOCUMENT_CHUNK_SIZE:
+                    for result in in_flight:
+                        result.get()
+                    in_flight = []
+
+    if pending:
+        in_flight.append(index.upsert(vectors=pending, async_req=True))
+        upserted += len(pending)
+
+    for result in in_flight:
+        result.get()
+
+    return upserted
+
+
+def _is_image_only_page(page) -> bool:
+    """
+    Check whether a PDF page can only contain images (e.g. a scanned page).
+
+    Inspects the page resources without decoding any streams: a page with
+    no fonts cannot produce text, so if it only draws image XObjects there
+    is nothing to extract.
+
+    Args:
+        page: pypdf PageObject
+
+    Returns:
+        True if the page has no fonts and only image XObjects
+    """
+    resources = page.get("/Resources")
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if "/Font" in resources:
+        return False
+
+    xobjects = resources.get("/XObject")
+    if xobjects is None:
+        return False
+    xobjects = xobjects.get_object()
+    return len(xobjects) > 0 and all(
+        xobj.get_object().get("/Subtype") == "/Image" for xobj in xobjects.values()
     )
-    return _openai_embeddings
 
-def get_finance_education_content(
+
+def _extract_page_text(page) -> str:
+    """
+    Extract text from a PDF page, skipping scanned/image-only pages.
+
+    Image-only pages are detected up front so their (large) image streams
+    are never decompressed. Pages yielding fewer than MIN_PAGE_TEXT_CHARS
+    characters are also treated as empty.
+
+    Args:
+        page: pypdf PageObject
+
+    Returns:
+        Page text, or "" for pages without usable text
+    """
+    if _is_image_only_page(page):
+        return ""
+
+    text = page.extract_text(extraction_mode="plain")
+    if len(text.strip()) < MIN_PAGE_TEXT_CHARS:
+        return ""
+    return text
+
+
+def _load_one_pdf(path: Path) -> List[Document]:
+    """
+    Load one PDF as a Document per page.
+
+    The file is memory-mapped and handed to PdfReader directly, so pages are
+    decoded from the OS page cache without copying the file into a buffer.
+    Runs in a worker process; must stay a module-level function.
+
+    Args:
+        path: PDF file to load
+
+    Returns:
+        One Document per page with "source" and "page" metadata. Pages
+        without usable text get empty content, so page numbers stay aligned
+        and the splitter drops them.
+    """
+    with open(path, "rb") as f:
+        if path.stat().st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            reader = PdfReader(mm)
+            return [
+                Document(
+                    page_content=_extract_page_text(page),
+                    metadata={"source": str(path), "page": i}
+                )
+                for i, page in enumerate(reader.pages)
+            ]
+
+
+def _pdf_paths(folder_path: str) -> List[Path]:
+    """List the PDFs under folder_path that the loader parses, in sorted order."""
+    return sorted(Path(folder_path).glob(PDF_GLOB))
+
+
+def _iter_parsed_pdfs(folder_path: str) -> Iterator[List[Document]]:
+    """
+    Parse every PDF under folder_path in parallel processes.
+
+    Workers are spawned rather than forked, since this runs in a pipeline
+    thread and forking a multithreaded process is unsafe. Closing the
+    generator cancels files that have not started parsing yet.
+
+    Args:
+        folder_path: Directory to search (recursively) for PDFs
+
+    Yields:
+        Page Documents of one file at a time, in sorted file order
+    """
+    paths = _pdf_paths(folder_path)
+    if not paths:
+        return
+
+    executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    try:
+        yield from executor.map(_load_one_pdf, paths)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _chunk_cache_key(folder_path: str, chunk_size: int, chunk_overlap: int) -> str:
+    """
+    Build a cache key from the PDFs in folder_path and the splitter settings.
+
+    The key changes whenever a loaded PDF is added, removed, or modified
+    (mtime or size), when chunk_size/chunk_overlap change, or when
+    CHUNK_CACHE_VERSION is bumped.
+    """
+    entries = []
+    for path in _pdf_paths(folder_path):
+        stat = path.stat()
+        entries.append((str(path), stat.st_mtime, stat.st_size))
+    key = (CHUNK_CACHE_VERSION, entries, chunk_size, chunk_overlap)
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+def _regularize_chunks(
+    chunks: List[Document],
+    text_splitter: RecursiveCharacterTextSplitter,
+    chunk_size: int
+) -> List[Document]:
+    """
+    Second pass over split chunks to even out their sizes.
+
+    1. Oversized chunks (> 1.1 * chunk_size) are split again.
+    2. Adjacent tiny chunks (< 0.2 * chunk_size each) from the same source
+       are merged while the result stays under 1.05 * chunk_size.
+
+    Fewer, denser chunks mean fewer embedding calls and better retrieval.
+
+    Args:
+        chunks: Chunks produced by text_splitter.split_documents
+        text_splitter: Splitter used to re-split oversized chunks
+        chunk_size: Target chunk size in characters
+
+    Returns:
+        Regularized list of chunks
+    """
+    max_size = 1.1 * chunk_size
+    tiny_size = 0.2 * chunk_size
+    merged_max = 1.05 * chunk_size
+
+    # Pass 1: re-split oversized chunks
+    resized: List[Document] = []
+    for chunk in chunks:
+        if len(chunk.page_content) > max_size:
+            resized.extend(text_splitter.split_documents([chunk]))
+        else:
+            resized.append(chunk)
+
+    # Pass 2: greedily merge adjacent tiny chunks from the same source
+    result: List[Document] = []
+    for chunk in resized:
+        prev = result[-1] if result else None
+        if (
+            prev is not None
+            and prev.metadata.get("source") == chunk.metadata.get("source")
+            and len(prev.page_content) < tiny_size
+            and len(chunk.page_content) < tiny_size
+            and len(prev.page_content) + len(chunk.page_content) + 1 < merged_max
+        ):
+            result[-1] = Document(
+                page_content=f"{prev.page_content}\n{chunk.page_content}",
+                metadata=dict(prev.metadata)
+            )
+        else:
+            result.append(chunk)
+
+    return result
+
+
+def _iter_document_chunks(
     folder_path: str,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
-) -> List[str]: 
+) -> Iterator[List[Document]]:
     """
-    Split financial education content into smaller chunks.
+    Yield chunks one PDF at a time, parsing the next files in the background.
+
+    Parsing runs as its own pipeline stage, so chunks of the first file are
+    available while later files are still being parsed. The full chunk list
+    is written to the on-disk cache once every file has been chunked.
 
     Args:
-        contents: List of content strings to split
+        folder_path: Directory containing the PDFs
         chunk_size: Size of each chunk
         chunk_overlap: Overlap between chunks
 
-    Returns:
-        List of content chunks
+    Yields:
+        Chunks of one PDF (or every cached chunk at once on a cache hit)
     """
-    # 1. Load all PDFs from the directory
-    loader = PyPDFDirectoryLoader(folder_path)
-    docs = loader.load()
-    
-    # 2. Define your splitting strategy
+    # 0. Reuse previously chunked documents if no PDF has changed
+    cache_dir = Path(RAG_CACHE_DIR)
+    cache_path = cache_dir / f"{_chunk_cache_key(folder_path, chunk_size, chunk_overlap)}.pkl"
+    if cache_path.exists():
+        with cache_path.open("rb") as f:
+            all_chunks = pickle.load(f)
+        print(f"Loaded {len(all_chunks)} cached chunks from {cache_path}")
+        yield all_chunks
+        return
+
+    # 1. Define your splitting strategy
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         separators=["\n\n", "\n", " ", ""]
     )
-    # 3. Split all documents at once
-    all_chunks = text_splitter.split_documents(docs)
+
+    all_chunks: List[Document] = []
+    with closing(_threaded(_iter_parsed_pdfs(folder_path))) as parsed_files:
+        for pages in parsed_files:
+            # 2. Split the file, re-split oversized chunks and merge tiny neighbours
+            chunks = text_splitter.split_documents(pages)
+            chunks = _regularize_chunks(chunks, text_splitter, chunk_size)
+            all_chunks.extend(chunks)
+            yield chunks
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with cache_path.open("wb") as f:
+        pickle.dump(all_chunks, f)
 
     print(f"Total chunks created: {len(all_chunks)}")
-    return all_chunks
+
+
+def _iter_chunk_stream(folder_path: str) -> Iterator[Document]:
+    """
+    Yield chunks one at a time while later PDFs are parsed in the background.
+
+    Closing this generator stops the background chunking stage. It must be
+    closed by the thread that iterates it, which _embed_and_upsert does.
+
+    Args:
+        folder_path: Directory containing the PDFs
+
+    Yields:
+        Chunk Documents, in file order
+    """
+    with closing(_threaded(_iter_document_chunks(folder_path))) as chunk_stream:
+        for chunks in chunk_stream:
+            yield from chunks
+
+
+def get_finance_education_content(
+    folder_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
+) -> List[str]: 
+    """
+    Split financial education content into smaller chunks.
+
+    Args:
+        contents: List of content strings to split
+        chunk_size: Size of each chunk
+        chunk_overlap: Overlap between chunks
+
+    Returns:
+        List of content chunks
+    """
+    return [
+        chunk
+        for chunks in _iter_document_chunks(folder_path, chunk_size, chunk_overlap)
+        for chunk in chunks
+    ]
 
  
-def save_embeddings(documents: List, force_reindex: bool = False) -> PineconeVectorStore:
+def save_embeddings(
+    documents: Iterable[Document],
+    force_reindex: bool = False,
+    pool_threads: int = PINECONE_POOL_THREADS,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    verify: bool = False,
+    incremental: bool = False
+) -> PineconeVectorStore:
     """
     Save document embeddings to Pinecone vector database.
 
@@ -139,42 +783,119 @@ def save_embeddings(documents: List, force_reindex: bool = False) -> PineconeVec
     and only creates/updates them if necessary.
 
     Args:
-        documents: List of LangChain Document objects to embed and store
-        force_reindex: If True, delete existing index and recreate it.
+        documents: LangChain Document objects to embed and store (a lazy
+                   iterable is consumed only if indexing actually happens)
+        force_reindex: If True, delete existing index and recreate it, once
+                      the first document has been produced.
                       If False, skip if index already has documents.
+        pool_threads: Number of concurrent upsert requests to Pinecone
+        batch_size: Vectors per upsert request
+        verify: If True, fetch index stats after upserting and report the
+                stored vector count (one extra round-trip)
+        incremental: If True and the index already has documents, embed and
+                     upsert only chunks that are not stored yet instead of
+                     skipping. Ignored when force_reindex is True. Needs an
+                     index built with content-hash IDs; an older index with
+                     random IDs must be rebuilt once with force_reindex.
 
     Returns:
         PineconeVectorStore: The vector store instance
 
     Raises:
-        ValueError: If required API keys are not set
+        ValueError: If required API keys are not set, if the embedding
+                    dimension does not match an existing index (unless
+                    force_reindex), if incremental is requested for an
+                    index without content-hash IDs, or if force_reindex is
+                    given no documents (the existing index is kept)
     """
     # Get clients with error handling
     pc = _get_pinecone_client()
-    embeddings = _get_openai_embeddings()
 
-    # Check if index exists
-    existing_indexes = pc.list_indexes().names()
-    index_exists = INDEX_NAME in existing_indexes
+    # Check if index exists, how many vectors it holds and their dimension
+    index, vector_count, index_dimension = _index_state(pc, pool_threads)
+
+    return _save_to_index(
+        pc,
+        index,
+        vector_count,
+        index_dimension,
+        documents,
+        force_reindex=force_reindex,
+        pool_threads=pool_threads,
+        batch_size=batch_size,
+        verify=verify,
+        incremental=incremental
+    )
+
+
+def _save_to_index(
+    pc: Pinecone,
+    index,
+    vector_count: int,
+    index_dimension: Optional[int],
+    documents: Iterable[Document],
+    force_reindex: bool = False,
+    pool_threads: int = PINECONE_POOL_THREADS,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    verify: bool = False,
+    incremental: bool = False
+) -> PineconeVectorStore:
+    """
+    Body of save_embeddings, given the index state the caller already looked up.
+
+    Args:
+        pc: Pinecone client
+        index: Index handle from _index_state, or None if the index does not exist
+        vector_count: Vectors stored in the index (0 if it does not exist)
+        index_dimension: Vector dimension of the index (None if it does not exist)
+        documents, force_reindex, pool_threads, batch_size, verify, incremental:
+            See save_embeddings
+
+    Returns:
+        PineconeVectorStore: The vector store instance
+    """
+    embeddings = _get_embeddings()
+    index_exists = index is not None
+
+    skip_existing = False
 
     if index_exists:
-        # Get index stats to check if it has documents
-        index = pc.Index(INDEX_NAME)
-        stats = index.describe_index_stats()
-        vector_count = stats.get('total_vector_count', 0)
+        # Fail before any parsing or embedding if the vectors cannot be stored
+        if not force_reindex:
+            _check_dimension(embeddings, index_dimension)
+
+        # Only probe for stored chunks when there can be any to skip
+        skip_existing = incremental and vector_count > 0 and not force_reindex
+
+        if skip_existing and not _uses_chunk_ids(index):
+            raise ValueError(
+                f"Index '{INDEX_NAME}' was not built with content-hash vector IDs, "
+                "so incremental indexing would duplicate every vector. "
+                "Rebuild it once with force_reindex=True."
+            )
 
-        if vector_count > 0 and not force_reindex:
+        if vector_count > 0 and not force_reindex and not incremental:
             print(f"Index '{INDEX_NAME}' already exists with {vector_count} vectors. Skipping indexing.")
             print("Use force_reindex=True to recreate the index.")
 
             # Return existing vector store
             vectorstore = PineconeVectorStore(
-                index_name=INDEX_NAME,
+                index=index,
                 embedding=embeddings
             )
             return vectorstore
 
         if force_reindex:
+            # Make sure there is something to index before dropping the old
+            # index: a lazy stream only parses its first PDF here
+            documents = iter(documents)
+            first = next(documents, None)
+            if first is None:
+                raise ValueError(
+                    f"No documents to index; keeping existing index '{INDEX_NAME}'."
+                )
+            documents = itertools.chain([first], documents)
+
             print(f"Deleting existing index '{INDEX_NAME}' with {vector_count} vectors...")
             pc.delete_index(INDEX_NAME)
             index_exists = False
@@ -184,24 +905,29 @@ def save_embeddings(documents: List, force_reindex: bool = False) -> PineconeVec
         print(f"Creating new Pinecone index '{INDEX_NAME}'...")
         pc.create_index(
             name=INDEX_NAME,
-            dimension=1536,  # Standard for OpenAI text-embedding-3-small
+            dimension=_embedding_dimension(embeddings),
             metric='cosine',
             spec=ServerlessSpec(cloud='aws', region='us-east-1')
         )
         print("Index created successfully.")
+        index = pc.Index(INDEX_NAME, pool_threads=pool_threads)
 
-    # Create embeddings and store in Pinecone
-    print(f"Embedding and storing {len(documents)} documents in Pinecone...")
-    vectorstore = PineconeVectorStore.from_documents(
-        documents=documents,
-        embedding=embeddings,
-        index_name=INDEX_NAME
+    # Create embeddings in explicit batches and upsert into Pinecone
+    print("Embedding and storing documents in Pinecone...")
+    upserted = _embed_and_upsert(
+        index, documents, embeddings, batch_size=batch_size, skip_existing=skip_existing
     )
 
-    # Verify storage
-    index = pc.Index(INDEX_NAME)
-    stats = index.describe_index_stats()
-    print(f"Successfully stored {stats.get('total_vector_count', 0)} vectors in Pinecone.")
+    vectorstore = PineconeVectorStore(
+        index=index,
+        embedding=embeddings
+    )
+
+    if verify:
+        stats = index.describe_index_stats()
+        print(f"Successfully stored {stats.get('total_vector_count', 0)} vectors in Pinecone.")
+    else:
+        print(f"Successfully upserted {upserted} vectors in Pinecone.")
 
     return vectorstore
 
@@ -217,35 +943,47 @@ def get_vectorstore() -> PineconeVectorStore:
         ValueError: If the index doesn't exist or API keys are not set
     """
     pc = _get_pinecone_client()
-    embeddings = _get_openai_embeddings()
+    embeddings = _get_embeddings()
 
-    if INDEX_NAME not in pc.list_indexes().names():
-        raise ValueError(
-            f"Index '{INDEX_NAME}' does not exist. "
-            "Please create embeddings first using setup_finance_rag() or save_embeddings()."
+    try:
+        vectorstore = PineconeVectorStore(
+            index_name=INDEX_NAME,
+            embedding=embeddings
         )
-
-    vectorstore = PineconeVectorStore(
-        index_name=INDEX_NAME,
-        embedding=embeddings
-    )
+    except Exception as e:
+        # Only list indexes when resolving the index failed, so the common
+        # path does not pay for an extra control-plane round-trip
+        if not _index_exists(pc):
+            raise ValueError(
+                f"Index '{INDEX_NAME}' does not exist. "
+                "Please create embeddings first using setup_finance_rag() or save_embeddings()."
+            ) from e
+        raise
 
     return vectorstore
 
 
-def setup_finance_rag(folder_path: str, force_reindex: bool = False) -> PineconeVectorStore:
+def setup_finance_rag(
+    folder_path: str,
+    force_reindex: bool = False,
+    incremental: bool = False
+) -> PineconeVectorStore:
     """
     Complete workflow to set up the finance education RAG system.
 
     This function:
-    1. Loads and chunks documents from the folder
-    2. Checks if embeddings already exist
-    3. Creates/updates embeddings in Pinecone if needed
+    1. Checks if embeddings already exist (skips loading PDFs if so)
+    2. Loads and chunks documents from the folder
+    3. Creates/updates embeddings in Pinecone if needed, streaming chunks
+       into embedding/upsert while later files are still being parsed
     4. Returns the vector store for querying
 
     Args:
         folder_path: Path to directory containing financial education documents
         force_reindex: If True, recreate the index even if it exists
+        incremental: If True, add chunks that are not in the index yet
+                     instead of skipping a populated index (requires an
+                     index built with content-hash IDs; see save_embeddings)
 
     Returns:
         PineconeVectorStore: Ready-to-use vector store for querying
@@ -258,13 +996,32 @@ def setup_finance_rag(folder_path: str, force_reindex: bool = False) -> Pinecone
     print("Setting up Finance Education RAG System")
     print("=" * 60)
 
-    # Step 1: Load and chunk documents
-    print("\n[1/2] Loading and chunking documents...")
-    documents = get_finance_education_content(folder_path)
+    # Look the index up once; the state is passed on to the indexing step
+    pc = _get_pinecone_client()
+    index, vector_count, index_dimension = _index_state(pc)
+
+    # Skip PDF parsing and chunking entirely when the index is already populated
+    if vector_count > 0 and not force_reindex and not incremental:
+        embeddings = _get_embeddings()
+        _check_dimension(embeddings, index_dimension)
+        print(f"\nIndex '{INDEX_NAME}' already has {vector_count} vectors. Skipping ingestion.")
+        return PineconeVectorStore(
+            index=index,
+            embedding=embeddings
+        )
 
-    # Step 2: Create/update embeddings in Pinecone
-    print("\n[2/2] Setting up vector database...")
-    vectorstore = save_embeddings(documents, force_reindex=force_reindex)
+    # Parse → chunk → embed → upsert run as overlapping pipeline stages: chunks
+    # stream into save_embeddings while later PDFs are still being parsed
+    print("\nLoading, chunking and embedding documents...")
+    vectorstore = _save_to_index(
+        pc,
+        index,
+        vector_count,
+        index_dimension,
+        _iter_chunk_stream(folder_path),
+        force_reindex=force_reindex,
+        incremental=incremental
+    )
 
     print("\n" + "=" * 60)
     print("RAG System Setup Complete!")
@@ -285,17 +1042,21 @@ if __name__ == "__main__":
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python financeEd_rag.py <folder_path> [--force-reindex]")
+        print("Usage: python financeEd_rag.py <folder_path> [--force-reindex | --incremental]")
         print("\nExample:")
         print("  python financeEd_rag.py ./financial_docs")
         print("  python financeEd_rag.py ./financial_docs --force-reindex")
+        print("  python financeEd_rag.py ./financial_docs --incremental")
+        print("\n--incremental needs an index built with content-hash IDs; rebuild an")
+        print("older index once with --force-reindex.")
         sys.exit(1)
 
     folder_path = 'src/data/resources/'
     force_reindex = "--force-reindex" in sys.argv
+    incremental = "--incremental" in sys.argv
 
     # Setup the RAG system
-    vectorstore = setup_finance_rag(folder_path, force_reindex=force_reindex)
+    vectorstore = setup_finance_rag(folder_path, force_reindex=force_reindex, incremental=incremental)
 
     # Example query
     print("\n" + "=" * 60)
@@ -0,0 +1,227 @@
+"""
+Local ONNX Embeddings
+
+Runs a BGE/E5-style sentence embedding model locally with ONNX Runtime,
+dynamically quantized to INT8. Intended for bulk ingestion without
+per-request network calls to the OpenAI embeddings API.
+
+Requires the optional dependencies:
+    pip install "optimum[onnxruntime]" transformers
+
+Usage:
+    # Select the backend for ingestion and retrieval
+    export EMBEDDING_BACKEND=onnx
+    export LOCAL_EMBEDDING_MODEL=BAAI/bge-small-en-v1.5
+
+    from src.rag.local_embeddings import LocalONNXEmbeddings
+    embeddings = LocalONNXEmbeddings()
+    vectors = embeddings.embed_documents(["What is compound interest?"])
+
+Note:
+    Vectors from a local model are not comparable to OpenAI vectors, so the
+    same backend must be used to build the index and to query it.
+"""
+
+import platform
+from pathlib import Path
+from typing import List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from src.config import LOCAL_EMBEDDING_MODEL, ONNX_CACHE_DIR as _ONNX_CACHE_DIR_SETTING
+
+# Token budget per inference batch (batch size x padded sequence length)
+MAX_BATCH_TOKENS = 8192
+
+# Longest input accepted by BGE/E5 base models
+MAX_SEQUENCE_LENGTH = 512
+
+# Where exported and quantized ONNX models are stored between runs
+ONNX_CACHE_DIR = Path(_ONNX_CACHE_DIR_SETTING)
+
+# x86 CPU flags mapped to optimum's quantization presets, best first;
+# x86 hosts without any of them fall back to avx2
+_X86_QUANTIZATION_TARGETS = (("avx512_vnni", "avx512_vnni"), ("avx512f", "avx512"))
+
+
+class LocalONNXEmbeddings(Embeddings):
+    """
+    LangChain embeddings backed by an INT8-quantized ONNX model.
+
+    On first use the Hugging Face model is exported to ONNX and dynamically
+    quantized to INT8; later runs load the quantized model from disk.
+    Embeddings use CLS pooling followed by L2 normalization (BGE convention).
+
+    Args:
+        model_name: Hugging Face model id to export
+        cache_dir: Directory for exported/quantized models
+        max_batch_tokens: Maximum padded tokens per inference batch
+
+    Raises:
+        ImportError: If optimum[onnxruntime] or transformers is not installed
+    """
+
+    def __init__(
+        self,
+        model_name: str = LOCAL_EMBEDDING_MODEL,
+        cache_dir: Path = ONNX_CACHE_DIR,
+        max_batch_tokens: int = MAX_BATCH_TOKENS
+    ):
+        try:
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "EMBEDDING_BACKEND=onnx requires optional dependencies. "
+                'Install them with: pip install "optimum[onnxruntime]" transformers'
+            ) from e
+
+        self.model_name = model_name
+        self.max_batch_tokens = max_batch_tokens
+
+        model_dir = Path(cache_dir) / model_name.replace("/", "--")
+        if not (model_dir / "model_quantized.onnx").exists():
+            _export_quantized_model(model_name, model_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir,
+            file_name="model_quantized.onnx"
+        )
+
+    @property
+    def dimension(self) -> int:
+        """Size of the vectors produced by the model."""
+        return self.model.config.hidden_size
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with dynamic, token-budgeted batching.
+
+        Texts are sorted by token length so each batch pads to a similar
+        length, and a batch closes once batch_size x longest_sequence would
+        exceed max_batch_tokens.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One normalized vector per text, aligned with texts
+        """
+        if not texts:
+            return []
+
+        lengths = [
+            min(len(ids), MAX_SEQUENCE_LENGTH)
+            for ids in self.tokenizer(texts, add_special_tokens=True)["input_ids"]
+        ]
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        batch: List[int] = []
+        for i in order:
+            # Sorted ascending, so the current text is the longest in the batch
+            if batch and (len(batch) + 1) * lengths[i] > self.max_batch_tokens:
+                self._embed_batch(texts, batch, vectors)
+                batch = []
+            batch.append(i)
+        if batch:
+            self._embed_batch(texts, batch, vectors)
+
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a single query.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Normalized query vector
+        """
+        return self.embed_documents([text])[0]
+
+    def _embed_batch(
+        self,
+        texts: List[str],
+        indices: List[int],
+        vectors: List[Optional[List[float]]]
+    ) -> None:
+        """Run one padded batch through the model and scatter results into vectors."""
+        import numpy as np
+
+        inputs = self.tokenizer(
+            [texts[i] for i in indices],
+            padding="longest",
+            truncation=True,
+            max_length=MAX_SEQUENCE_LENGTH,
+            return_tensors="np"
+        )
+        outputs = self.model(**inputs)
+
+        cls = np.asarray(outputs.last_hidden_state)[:, 0]
+        cls = cls / np.linalg.norm(cls, axis=1, keepdims=True)
+
+        for i, values in zip(indices, cls.tolist()):
+            vectors[i] = values
+
+
+def _cpu_flags() -> set:
+    """Read the host CPU flags from /proc/cpuinfo (empty where it is unavailable)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def _quantization_target() -> str:
+    """
+    Pick the AutoQuantizationConfig preset for the host CPU.
+
+    Returns:
+        "arm64" on ARM hosts; otherwise "avx512_vnni" or "avx512" when the
+        CPU reports those flags, else "avx2"
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    flags = _cpu_flags()
+    for flag, target in _X86_QUANTIZATION_TARGETS:
+        if flag in flags:
+            return target
+    return "avx2"
+
+
+def _export_quantized_model(model_name: str, model_dir: Path) -> None:
+    """
+    Export a Hugging Face model to ONNX and quantize it to INT8.
+
+    Uses dynamic quantization (weights stored as INT8, activations quantized
+    at runtime), which needs no calibration data. The preset matches the
+    host CPU (see _quantization_target).
+
+    Args:
+        model_name: Hugging Face model id
+        model_dir: Output directory for the tokenizer and model_quantized.onnx
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    target = _quantization_target()
+    print(f"Exporting '{model_name}' to ONNX with INT8 quantization ({target})...")
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+    model.save_pretrained(model_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(model_dir)
+
+    quantizer = ORTQuantizer.from_pretrained(model)
+    qconfig = getattr(AutoQuantizationConfig, target)(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=model_dir, quantization_config=qconfig)
+
+    print(f"Quantized model saved to {model_dir}")
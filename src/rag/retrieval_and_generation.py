@@ -1,9 +1,38 @@
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 from pydantic import BaseModel
 from langchain.tools import tool
+from langchain_pinecone import PineconeVectorStore
 
 from .ingestion import get_vectorstore
 from src.config import DEFAULT_RETRIEVAL_K
-from src.prompts import RETRIEVE_TOOL_DESCRIPTION
+from src.prompts import RETRIEVE_TOOL_DESCRIPTION, RETRIEVE_BATCH_TOOL_DESCRIPTION
+
+
+# Maximum similarity searches retrieve_batch runs at once
+BATCH_MAX_WORKERS = 8
+
+
+@functools.cache
+def _vs() -> PineconeVectorStore:
+    """Get the vector store reused across queries, creating it on first use."""
+    return get_vectorstore()
+
+
+def _batch_vs() -> PineconeVectorStore:
+    """
+    Build a vector store for one async batch.
+
+    It shares the cached store's sync index and embeddings but owns its
+    async index context, so concurrent batches do not open and close each
+    other's HTTP session.
+    """
+    shared = _vs()
+    return PineconeVectorStore(index=shared.index, embedding=shared.embeddings)
 
 
 class retrieveSchema(BaseModel):
@@ -24,6 +53,40 @@ def retrieve_tool(query: str) -> str:
     return retrieved_docs
 
 
+@tool("retrieve_batch_tool", description=RETRIEVE_BATCH_TOOL_DESCRIPTION)
+def retrieve_batch_tool(queries: str) -> str:
+    """
+    Tool to retrieve relevant documents for several queries at once.
+
+    Args:
+        queries (str): JSON list of query strings, e.g. '["What is an ETF?", "What is a bond?"]'.
+    Returns:
+        str: Retrieved documents for each query, one section per query.
+    """
+    try:
+        query_list = json.loads(queries)
+    except json.JSONDecodeError:
+        return "Error: queries must be a JSON list of strings."
+
+    if not isinstance(query_list, list) or not all(isinstance(q, str) for q in query_list):
+        return "Error: queries must be a JSON list of strings."
+
+    results = retrieve_batch(query_list)
+    return "\n\n".join(
+        f"Query: {query}\n{result}"
+        for query, result in zip(query_list, results)
+    )
+
+
+def _serialize_documents(retrieved_docs) -> str:
+    """Combine retrieved documents into a single string."""
+    parts = [
+        f"Source: {json.dumps(doc.metadata, separators=(',', ':'), default=str)}\nContent: {doc.page_content}"
+        for doc in retrieved_docs
+    ]
+    return "\n\n".join(parts)
+
+
 def retrieve_relevant_documents(query: str, k: int = DEFAULT_RETRIEVAL_K) -> str:
     """
     Retrieve relevant documents from the vector store based on the query.
@@ -35,16 +98,65 @@ def retrieve_relevant_documents(query: str, k: int = DEFAULT_RETRIEVAL_K) -> str
     Returns:
         str: Retrieved documents as a single string.
     """
-    # Get the vector store
-    vectorstore = get_vectorstore()
+    # Get the (cached) vector store
+    vectorstore = _vs()
 
     # Perform similarity search
     retrieved_docs = vectorstore.similarity_search(query, k=k)
 
-    # Combine retrieved documents into a single string
-    serialized = "\n\n".join(
-        (f"Source: {doc.metadata}\nContent: {doc.page_content}")
-        for doc in retrieved_docs
-    )
+    return _serialize_documents(retrieved_docs)
+
+
+async def retrieve_batch_async(
+    queries: List[str],
+    k: int = DEFAULT_RETRIEVAL_K
+) -> List[str]:
+    """
+    Retrieve documents for several queries concurrently.
+
+    All similarity searches are issued at once with asyncio.gather, so the
+    Pinecone round-trips overlap instead of running one after another. They
+    run inside one async index context on a store built for this batch, so
+    every query shares the same HTTP session and none of them closes it
+    while the others are still in flight.
+
+    Args:
+        queries (List[str]): The queries to search for.
+        k (int): Number of documents to retrieve per query.
+
+    Returns:
+        List[str]: Retrieved documents for each query, in input order.
+    """
+    vectorstore = _batch_vs()
+
+    async with vectorstore:
+        results = await asyncio.gather(
+            *[vectorstore.asimilarity_search(query, k=k) for query in queries]
+        )
+
+    return [_serialize_documents(docs) for docs in results]
+
+
+def retrieve_batch(queries: List[str], k: int = DEFAULT_RETRIEVAL_K) -> List[str]:
+    """
+    Retrieve documents for several queries concurrently from synchronous code.
+
+    The sync similarity searches run in a thread pool rather than on an event
+    loop, so this also works when called from a thread whose loop is already
+    running (e.g. a tool invoked by an async graph). Async callers should
+    await retrieve_batch_async instead.
+
+    Args:
+        queries (List[str]): The queries to search for.
+        k (int): Number of documents to retrieve per query.
+
+    Returns:
+        List[str]: Retrieved documents for each query, in input order.
+    """
+    if not queries:
+        return []
 
-    return serialized
+    vectorstore = _vs()
+    with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(queries))) as executor:
+        results = executor.map(lambda query: vectorstore.similarity_search(query, k=k), queries)
+        return [_serialize_documents(docs) for docs in results]
@@ -5,13 +5,33 @@ Manages conversation context to optimize token usage and stay within LLM limits.
 Uses smart trimming to keep recent messages while preserving important context.
 """
 
+import functools
 from typing import List, Dict, Any, Optional
-from langchain_core.messages import trim_messages, BaseMessage, HumanMessage, AIMessage
+from langchain_core.messages import (
+    trim_messages,
+    BaseMessage,
+    HumanMessage,
+    HumanMessageChunk,
+    AIMessage,
+    AIMessageChunk,
+)
 
 
 # Configuration
 DEFAULT_MAX_MESSAGES = 10  # Keep last 10 messages (5 turns)
 DEFAULT_MAX_TOKENS = 4000  # Approximate token limit for context
+TOKEN_ENCODING = "cl100k_base"  # tiktoken encoding used by OpenAI chat models
+TOKENS_PER_MESSAGE = 3  # Per-message overhead for role/structure
+
+# Message class <-> role lookups for format conversion. The exact-type table
+# is a fast path; other subclasses fall back to an isinstance check.
+_LC_TO_ROLE = {
+    HumanMessage: "user",
+    HumanMessageChunk: "user",
+    AIMessage: "assistant",
+    AIMessageChunk: "assistant",
+}
+_ROLE_TO_LC = {"user": HumanMessage, "assistant": AIMessage}
 
 
 def convert_to_dict_messages(messages: List[Any]) -> List[Dict[str, Any]]:
@@ -43,6 +63,79 @@ def convert_to_dict_messages(messages: List[Any]) -> List[Dict[str, Any]]:
     return result
 
 
+def _as_dict_messages(messages: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Return messages in dict format, skipping conversion when already dicts.
+
+    A list of only dicts is returned as-is (no copy); a list that contains
+    any LangChain message is converted element by element.
+    """
+    if all(isinstance(msg, dict) for msg in messages):
+        return messages
+    return convert_to_dict_messages(messages)
+
+
+@functools.cache
+def _get_token_encoding():
+    """
+    Load the tiktoken encoding once.
+
+    Returns None if tiktoken is not installed or the encoding cannot be
+    loaded (e.g. no network access to fetch it), in which case token counts
+    fall back to the character-based estimate.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception:
+        return None
+
+
+def _chars_to_tokens(total_chars: int) -> int:
+    """Convert a character count to an approximate token count."""
+    # Rough approximation: 1 token ≈ 4 characters
+    # Add overhead for role/structure: +20%
+    return int((total_chars / 4) * 1.2)
+
+
+def _content_text(content: Any) -> str:
+    """
+    Get the text of a message's content for token counting.
+
+    Multimodal content (a list of strings and content blocks) contributes
+    the text of its parts; any other non-string content is passed to str().
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, str):
+                parts.append(part)
+            elif isinstance(part, dict):
+                parts.append(part.get("text", ""))
+        return "".join(parts)
+    return str(content)
+
+
+def _estimate_from_dicts(dict_messages: List[Dict[str, Any]]) -> int:
+    """
+    Count tokens for messages already in dict format.
+
+    Uses tiktoken's batched encoder when available for exact counts,
+    otherwise the character-based estimate. Special-token text such as
+    "<|endoftext|>" in user input is counted as plain text.
+    """
+    contents = [_content_text(msg.get("content", "")) for msg in dict_messages]
+
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        counts = encoding.encode_batch(contents, num_threads=4, disallowed_special=())
+        return sum(len(tokens) for tokens in counts) + TOKENS_PER_MESSAGE * len(contents)
+
+    return _chars_to_tokens(len("".join(contents)))
+
+
 def trim_conversation_history(
     messages: List[Any],
     max_messages: Optional[int] = None,
@@ -83,18 +176,17 @@ def trim_conversation_history(
     if not messages:
         return messages
 
-    # Convert to dict format first (handles LangChain objects)
-    dict_messages = convert_to_dict_messages(messages)
-
     max_messages = max_messages or DEFAULT_MAX_MESSAGES
 
     # Strategy: Keep last N messages
     if strategy == "last":
-        if len(dict_messages) <= max_messages:
-            return dict_messages
+        if len(messages) <= max_messages:
+            # Dict input under the limit is returned as-is (no copy)
+            return _as_dict_messages(messages)
 
-        # Always keep the most recent messages
-        return dict_messages[-max_messages:]
+        # Always keep the most recent messages; slice before converting
+        # so only the kept tail is touched - O(max_messages), not O(n)
+        return _as_dict_messages(messages[-max_messages:])
 
     # Future: Add other strategies
     # elif strategy == "summary":
@@ -103,7 +195,7 @@ def trim_conversation_history(
     #     return _trim_by_relevance(dict_messages, max_messages)
 
     # Default: return converted messages
-    return dict_messages
+    return _as_dict_messages(messages)
 
 
 def trim_for_agent(
@@ -154,8 +246,9 @@ def estimate_token_count(messages: List[Any]) -> int:
     """
     Estimate token count for message list.
 
-    Rough estimation: 1 token ≈ 4 characters
-    More accurate counting would use tiktoken library.
+    Uses tiktoken (cl100k_base) for exact counts plus a small per-message
+    overhead. Falls back to 1 token ≈ 4 characters (+20%) if tiktoken
+    is unavailable.
 
     Args:
         messages: Message list (dicts or LangChain objects)
@@ -165,19 +258,10 @@ def estimate_token_count(messages: List[Any]) -> int:
 
     Examples:
         >>> messages = [{"role": "user", "content": "Hello world"}]
-        >>> estimate_token_count(messages)
-        3
+        >>> estimate_token_count(messages)  # 5 with tiktoken, 3 with the fallback
+        5
     """
-    # Convert to dict format first
-    dict_messages = convert_to_dict_messages(messages)
-
-    total_chars = sum(
-        len(msg.get("content", ""))
-        for msg in dict_messages
-    )
-    # Rough approximation: 1 token ≈ 4 characters
-    # Add overhead for role/structure: +20%
-    return int((total_chars / 4) * 1.2)
+    return _estimate_from_dicts(_as_dict_messages(messages))
 
 
 def should_trim_context(messages: List[Dict[str, Any]]) -> bool:
@@ -235,20 +319,27 @@ def get_context_summary(messages: List[Any]) -> str:
     if not messages:
         return "Empty conversation"
 
-    # Convert to dict format first
-    dict_messages = convert_to_dict_messages(messages)
+    # Convert to dict format once and reuse it for all counts
+    dict_messages = _as_dict_messages(messages)
 
     num_messages = len(dict_messages)
     num_turns = num_messages // 2
-    estimated_tokens = estimate_token_count(messages)
 
-    user_messages = [m for m in dict_messages if m.get("role") == "user"]
-    assistant_messages = [m for m in dict_messages if m.get("role") == "assistant"]
+    estimated_tokens = _estimate_from_dicts(dict_messages)
+
+    user_count = 0
+    assistant_count = 0
+    for msg in dict_messages:
+        role = msg.get("role")
+        if role == "user":
+            user_count += 1
+        elif role == "assistant":
+            assistant_count += 1
 
     return (
         f"{num_messages} messages ({num_turns} turns) - "
         f"~{estimated_tokens} tokens - "
-        f"{len(user_messages)} user, {len(assistant_messages)} assistant"
+        f"{user_count} user, {assistant_count} assistant"
     )
 
 
@@ -291,27 +382,21 @@ def _trim_by_relevance(
 
 def dict_to_langchain_message(msg_dict: Dict[str, Any]) -> BaseMessage:
     """Convert dict format to LangChain message object."""
-    role = msg_dict.get("role", "user")
-    content = msg_dict.get("content", "")
-
-    if role == "user":
-        return HumanMessage(content=content)
-    elif role == "assistant":
-        return AIMessage(content=content)
-    else:
-        # Default to human message
-        return HumanMessage(content=content)
+    # Unknown roles default to human message
+    message_cls = _ROLE_TO_LC.get(msg_dict.get("role", "user"), HumanMessage)
+    return message_cls(content=msg_dict.get("content", ""))
 
 
 def langchain_to_dict_message(msg: BaseMessage) -> Dict[str, Any]:
     """Convert LangChain message object to dict format."""
-    if isinstance(msg, HumanMessage):
-        role = "user"
-    elif isinstance(msg, AIMessage):
-        role = "assistant"
-    else:
-        role = "system"
-
+    role = _LC_TO_ROLE.get(type(msg))
+    if role is None:
+        if isinstance(msg, HumanMessage):
+            role = "user"
+        elif isinstance(msg, AIMessage):
+            role = "assistant"
+        else:
+            role = "system"
     return {
         "role": role,
         "content": msg.content
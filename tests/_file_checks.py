@@ -0,0 +1,121 @@
+"""
+Helpers shared by the file-checking test scripts.
+
+test_refactoring.py and test_simplified_graph.py verify the orchestration
+refactors by inspecting source files instead of importing them; these
+helpers read, parse and scan each file once. buffered_stdout is also used
+by test_routing.py when run as a script.
+"""
+
+import ast
+import contextlib
+import functools
+import io
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import FrozenSet, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def read_file(path: str) -> str:
+    """Read a project file once; later calls reuse the cached content."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+class ModuleFacts(NamedTuple):
+    """Names collected from one walk over a module's syntax tree."""
+
+    symbols: FrozenSet[str]
+    imports: FrozenSet[str]
+    graph_nodes: FrozenSet[str]
+
+
+@functools.lru_cache(maxsize=None)
+def module_ast(path: str) -> ast.Module:
+    """Parse a project module once; later calls reuse the cached tree."""
+    return ast.parse(read_file(path), filename=path)
+
+
+@functools.lru_cache(maxsize=None)
+def module_facts(path: str) -> ModuleFacts:
+    """Collect defined function/class names, imported names and graph node names."""
+    symbols: Set[str] = set()
+    imports: Set[str] = set()
+    graph_nodes: Set[str] = set()
+    for node in ast.walk(module_ast(path)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            symbols.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.update(alias.asname or alias.name for alias in node.names)
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "add_node"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            # workflow.add_node("name", node_fn)
+            graph_nodes.add(node.args[0].value)
+    return ModuleFacts(frozenset(symbols), frozenset(imports), frozenset(graph_nodes))
+
+
+def module_symbols(path: str) -> FrozenSet[str]:
+    """Names of the functions and classes defined in a module."""
+    return module_facts(path).symbols
+
+
+@functools.lru_cache(maxsize=None)
+def _literals_re(literals: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile one pattern that reports every literal in a single scan."""
+    # Lookahead so overlapping literals are all reported; longest first
+    alternation = "|".join(re.escape(s) for s in sorted(literals, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+def assert_all(content: str, checks: List[Tuple[str, str]]) -> None:
+    """
+    Assert every (literal, message) check is present, scanning content once.
+
+    Only the longest literal starting at an offset is captured, so a literal
+    also counts as found when it is a prefix of a captured match. Every
+    missing literal is reported together with its message.
+    """
+    matches = set(_literals_re(tuple(literal for literal, _ in checks)).findall(content))
+    missing = [
+        f"{message} (missing {literal!r})"
+        for literal, message in checks
+        if not any(match.startswith(literal) for match in matches)
+    ]
+    assert not missing, "; ".join(missing)
+
+
+def between(content: str, start: str, end: str, pos: int = 0) -> Optional[str]:
+    """Return the text between the first start marker at or after pos and the next end marker."""
+    i = content.find(start, pos)
+    if i < 0:
+        return None
+    i += len(start)
+    j = content.find(end, i)
+    return content[i:j] if j >= 0 else None
+
+
+def prefetch(paths: Tuple[str, ...]) -> None:
+    """Read the checked files concurrently so each test finds them cached."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for path in paths:
+            # Errors such as a missing file are left for the test that reads it
+            executor.submit(read_file, path)
+
+
+@contextlib.contextmanager
+def buffered_stdout() -> Iterator[None]:
+    """Collect printed output and write it to stdout in one call on exit."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
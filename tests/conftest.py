@@ -12,19 +12,56 @@ from unittest.mock import Mock, MagicMock
 
 
 # Environment fixtures
+MOCK_ENV_VARS = {
+    "OPENAI_API_KEY": "test-openai-key-12345",
+    "PINECONE_API_KEY": "test-pinecone-key-67890",
+    "PINECONE_INDEX_NAME": "test-finance-index",
+    "LLM_MODEL": "gpt-4o-mini",
+    "CHUNK_SIZE": "300",
+    "CHUNK_OVERLAP": "100",
+}
+
+
 @pytest.fixture
-def mock_env_vars(monkeypatch):
-    """Set up mock environment variables for testing."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key-12345")
-    monkeypatch.setenv("PINECONE_API_KEY", "test-pinecone-key-67890")
-    monkeypatch.setenv("PINECONE_INDEX_NAME", "test-finance-index")
-    monkeypatch.setenv("LLM_MODEL", "gpt-4o-mini")
-    monkeypatch.setenv("CHUNK_SIZE", "300")
-    monkeypatch.setenv("CHUNK_OVERLAP", "100")
-    return {
-        "OPENAI_API_KEY": "test-openai-key-12345",
-        "PINECONE_API_KEY": "test-pinecone-key-67890",
-    }
+def isolated_env_vars(monkeypatch):
+    """
+    Set up mock environment variables for a single test.
+
+    Function-scoped so the patched keys are undone after each test and no
+    later test can depend on them still being set.
+    """
+    for key, value in MOCK_ENV_VARS.items():
+        monkeypatch.setenv(key, value)
+    return MOCK_ENV_VARS
+
+
+@pytest.fixture(autouse=True)
+def _fresh_env_cache():
+    """Make each test read environment variables set by its own fixtures."""
+    from src.config import invalidate_env_cache
+
+    invalidate_env_cache()
+    yield
+    invalidate_env_cache()
+
+
+@pytest.fixture
+def env_sandbox():
+    """
+    Give a test os.environ to change freely, restoring a snapshot afterwards.
+
+    Cheaper than many monkeypatch.setenv/delenv calls, which are undone one
+    by one at teardown.
+    """
+    from src.config import invalidate_env_cache
+
+    saved = os.environ.copy()
+    try:
+        yield os.environ
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+        invalidate_env_cache()
 
 
 @pytest.fixture
@@ -69,16 +106,6 @@ def empty_file(temp_dir):
     return file_path
 
 
-@pytest.fixture
-def large_text_file(temp_dir):
-    """Create a large text file for testing."""
-    file_path = temp_dir / "large.txt"
-    # Create a 1MB file
-    content = "Financial education content.\n" * 50000
-    file_path.write_text(content)
-    return file_path
-
-
 @pytest.fixture
 def unicode_filename_file(temp_dir):
     """Create a file with unicode characters in the name."""
@@ -100,21 +127,20 @@ def nested_directory(temp_dir):
 
 
 # Mock fixtures for external services
-@pytest.fixture
-def mock_openai_embeddings():
-    """Mock OpenAI embeddings for testing."""
-    mock = MagicMock()
+# The mocks are built once per session; the function-scoped fixtures tests
+# request hand them out and afterwards reset them fully, return values and
+# side effects included, then configure them again, so nothing a test sets
+# on a mock leaks into later tests.
+def _configure_openai_embeddings(mock):
+    """Give the embeddings mock its default return values."""
     # Mock embedding vector (1536 dimensions for text-embedding-3-small)
     mock.embed_query.return_value = [0.1] * 1536
     mock.embed_documents.return_value = [[0.1] * 1536]
-    return mock
+    mock.dimension = 1536
 
 
-@pytest.fixture
-def mock_pinecone_client():
-    """Mock Pinecone client for testing."""
-    mock_client = MagicMock()
-
+def _configure_pinecone_client(mock_client):
+    """Give the Pinecone client mock its default return values."""
     # Mock list_indexes
     mock_indexes = MagicMock()
     mock_indexes.names.return_value = []
@@ -132,14 +158,9 @@ def mock_pinecone_client():
     mock_index.describe_index_stats.return_value = mock_stats
     mock_client.Index.return_value = mock_index
 
-    return mock_client
-
-
-@pytest.fixture
-def mock_vectorstore():
-    """Mock PineconeVectorStore for testing."""
-    mock = MagicMock()
 
+def _configure_vectorstore(mock):
+    """Give the vector store mock its default return values."""
     # Mock similarity search
     mock_doc = Mock()
     mock_doc.page_content = "Sample financial content about budgeting"
@@ -149,10 +170,59 @@ def mock_vectorstore():
     # Mock from_documents
     mock.from_documents = MagicMock(return_value=mock)
 
+
+def _reset_and_configure(mock, configure):
+    """Clear calls, return values and side effects, then restore the defaults."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    configure(mock)
+
+
+@pytest.fixture(scope="session")
+def _session_openai_embeddings():
+    """Mock OpenAI embeddings, built once per session."""
+    mock = MagicMock()
+    _configure_openai_embeddings(mock)
     return mock
 
 
+@pytest.fixture(scope="session")
+def _session_pinecone_client():
+    """Mock Pinecone client, built once per session."""
+    mock_client = MagicMock()
+    _configure_pinecone_client(mock_client)
+    return mock_client
+
+
+@pytest.fixture(scope="session")
+def _session_vectorstore():
+    """Mock PineconeVectorStore, built once per session."""
+    mock = MagicMock()
+    _configure_vectorstore(mock)
+    return mock
+
+
+@pytest.fixture
+def mock_openai_embeddings(_session_openai_embeddings):
+    """Mock OpenAI embeddings for testing."""
+    yield _session_openai_embeddings
+    _reset_and_configure(_session_openai_embeddings, _configure_openai_embeddings)
+
+
+@pytest.fixture
+def mock_pinecone_client(_session_pinecone_client):
+    """Mock Pinecone client for testing."""
+    yield _session_pinecone_client
+    _reset_and_configure(_session_pinecone_client, _configure_pinecone_client)
+
+
 @pytest.fixture
+def mock_vectorstore(_session_vectorstore):
+    """Mock PineconeVectorStore for testing."""
+    yield _session_vectorstore
+    _reset_and_configure(_session_vectorstore, _configure_vectorstore)
+
+
+@pytest.fixture(scope="session")
 def mock_documents():
     """Create mock LangChain documents for testing."""
     docs = []
@@ -164,6 +234,18 @@ def mock_documents():
     return docs
 
 
+@pytest.fixture(scope="session")
+def finance_app():
+    """
+    LangGraph app with memory, built once and shared by every test that needs it.
+
+    Pass it to web_app.app.get_app(finance_app) to have the web UI use it.
+    """
+    from src.orchestration import create_app_with_memory
+
+    return create_app_with_memory()
+
+
 @pytest.fixture
 def mock_llm():
     """Mock ChatOpenAI LLM for testing."""
@@ -173,13 +255,13 @@ def mock_llm():
 
 
 # Test data fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_query():
     """Sample user query for testing."""
     return "How do I create a monthly budget?"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def edge_case_queries():
     """Collection of edge case queries for testing."""
     return {
@@ -4,7 +4,66 @@ Test script to verify Phase 2 refactoring changes.
 Checks file contents directly without triggering full imports.
 """
 
-import re
+import sys
+from pathlib import Path
+
+# Add project root to Python path for direct execution
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests._file_checks import (
+    assert_all,
+    between,
+    buffered_stdout,
+    module_facts,
+    module_symbols,
+    prefetch,
+    read_file,
+)
+
+
+# Project files read by the tests below
+_CHECKED_FILES = (
+    "src/orchestration/types.py",
+    "src/orchestration/nodes.py",
+    "src/orchestration/graph.py",
+    "src/orchestration/__init__.py",
+    "main_langgraph.py",
+    "test_langgraph.py",
+    "LANGGRAPH_IMPLEMENTATION.md",
+)
+
+# Literals that must appear in each file, with their failure messages
+_TYPES_CHECKS = [
+    ("agents_queue: List[AgentType]", "agents_queue field not found"),
+    ("current_index: int", "current_index field not found"),
+    ("needs_synthesis: bool", "needs_synthesis field not found"),
+    ("execution_plan: Optional[ExecutionPlan]", "execution_plan field not in state"),
+]
+_NODES_CHECKS = [
+    ("execution_plan = state.get(\"execution_plan\")", "execution_plan not checked in agent node"),
+    ("current_index", "current_index not used"),
+    ("execution_plan = None", "supervisor doesn't initialize execution_plan"),
+    ("agents_to_execute = [supervisor_decision.primary_agent]", "supervisor doesn't build agents_to_execute"),
+]
+_AGENT_EDGES_CHECKS = [
+    ("should_continue_sequence", "Agent routing doesn't use should_continue_sequence"),
+    ('"education_agent": "education_agent"', "Agents can't route to education"),
+    ('"market_agent": "market_agent"', "Agents can't route to market"),
+]
+_DOC_CHECKS = [
+    ("ExecutionPlan", "ExecutionPlan not documented"),
+    ("should_continue_sequence", "should_continue_sequence not documented"),
+    ("v2.0.0", "Version 2.0.0 not found"),
+    ("Native LangGraph Patterns", "Native patterns not documented"),
+    ("Phase 2 (Completed)", "Phase 2 not marked complete"),
+    ("multi_agent_orchestrator", "Orchestrator not mentioned"),
+    ("Nodes:** 10", "Node count not updated"),
+]
+_INIT_CHECKS = [
+    ("ExecutionPlan", "ExecutionPlan not exported"),
+    ('"ExecutionPlan"', "ExecutionPlan not in __all__"),
+]
 
 
 def test_types_file():
@@ -13,22 +72,14 @@ def test_types_file():
     print("Testing types.py")
     print("=" * 70)
 
-    with open("src/orchestration/types.py", "r") as f:
-        content = f.read()
+    content = read_file("src/orchestration/types.py")
 
-    assert "class ExecutionPlan" in content, "ExecutionPlan class not found"
+    assert "ExecutionPlan" in module_symbols("src/orchestration/types.py"), "ExecutionPlan class not found"
+    assert_all(content, _TYPES_CHECKS)
     print("✓ ExecutionPlan class exists")
-
-    assert "agents_queue: List[AgentType]" in content, "agents_queue field not found"
     print("✓ agents_queue field exists")
-
-    assert "current_index: int" in content, "current_index field not found"
     print("✓ current_index field exists")
-
-    assert "needs_synthesis: bool" in content, "needs_synthesis field not found"
     print("✓ needs_synthesis field exists")
-
-    assert "execution_plan: Optional[ExecutionPlan]" in content, "execution_plan field not in state"
     print("✓ execution_plan added to FinancialAssistantState")
 
     print()
@@ -40,29 +91,20 @@ def test_nodes_file():
     print("Testing nodes.py")
     print("=" * 70)
 
-    with open("src/orchestration/nodes.py", "r") as f:
-        content = f.read()
+    content = read_file("src/orchestration/nodes.py")
+    symbols = module_symbols("src/orchestration/nodes.py")
 
     # Check orchestrator removed
-    assert "def multi_agent_orchestrator_node" not in content, "Orchestrator node still exists"
+    assert "multi_agent_orchestrator_node" not in symbols, "Orchestrator node still exists"
     print("✓ multi_agent_orchestrator_node removed")
 
-    # Check new function added
-    assert "def should_continue_sequence" in content, "should_continue_sequence not found"
+    # Check new function, execution plan handling in _execute_agent_node,
+    # and supervisor creating the execution plan
+    assert "should_continue_sequence" in symbols, "should_continue_sequence not found"
+    assert_all(content, _NODES_CHECKS)
     print("✓ should_continue_sequence added")
-
-    # Check execution plan handling in _execute_agent_node
-    assert "execution_plan = state.get(\"execution_plan\")" in content, "execution_plan not checked in agent node"
     print("✓ _execute_agent_node checks execution_plan")
-
-    assert "current_index" in content, "current_index not used"
     print("✓ current_index advancement implemented")
-
-    # Check supervisor creates execution plan
-    with open("src/orchestration/nodes.py", "r") as f:
-        content = f.read()
-    assert "execution_plan = None" in content, "supervisor doesn't initialize execution_plan"
-    assert "agents_to_execute = [supervisor_decision.primary_agent]" in content
     print("✓ supervisor_node initializes execution_plan")
 
     print()
@@ -74,31 +116,27 @@ def test_graph_file():
     print("Testing graph.py")
     print("=" * 70)
 
-    with open("src/orchestration/graph.py", "r") as f:
-        content = f.read()
+    content = read_file("src/orchestration/graph.py")
+    facts = module_facts("src/orchestration/graph.py")
 
     # Check orchestrator not imported
-    assert "multi_agent_orchestrator_node" not in content, "Orchestrator still imported"
+    assert "multi_agent_orchestrator_node" not in facts.imports, "Orchestrator still imported"
     print("✓ multi_agent_orchestrator_node not imported")
 
     # Check new routing function imported
-    assert "should_continue_sequence" in content, "should_continue_sequence not imported"
+    assert "should_continue_sequence" in facts.imports, "should_continue_sequence not imported"
     print("✓ should_continue_sequence imported")
 
     # Check orchestrator not added as node
-    assert 'workflow.add_node("multi_agent_orchestrator"' not in content, "Orchestrator still added as node"
+    assert "multi_agent_orchestrator" not in facts.graph_nodes, "Orchestrator still added as node"
     print("✓ Orchestrator node not added to workflow")
 
     # Check conditional edges updated
-    edges_section = re.search(r"# Agent routing.*?workflow\.add_edge", content, re.DOTALL)
-    if edges_section:
-        edges_text = edges_section.group(0)
-        assert "should_continue_sequence" in edges_text, "Agent routing doesn't use should_continue_sequence"
+    edges_text = between(content, "# Agent routing", "workflow.add_edge")
+    if edges_text is not None:
+        # Check routing function is used and all agents can route to each other
+        assert_all(edges_text, _AGENT_EDGES_CHECKS)
         print("✓ Agent routing uses should_continue_sequence")
-
-        # Check all agents can route to each other
-        assert '"education_agent": "education_agent"' in edges_text, "Agents can't route to education"
-        assert '"market_agent": "market_agent"' in edges_text, "Agents can't route to market"
         print("✓ Agents can route to any other agent")
 
     print()
@@ -110,14 +148,11 @@ def test_init_file():
     print("Testing __init__.py")
     print("=" * 70)
 
-    with open("src/orchestration/__init__.py", "r") as f:
-        content = f.read()
+    content = read_file("src/orchestration/__init__.py")
 
-    assert "ExecutionPlan" in content, "ExecutionPlan not exported"
+    # Check ExecutionPlan is exported and listed in __all__
+    assert_all(content, _INIT_CHECKS)
     print("✓ ExecutionPlan exported")
-
-    # Check __all__ includes ExecutionPlan
-    assert '"ExecutionPlan"' in content, "ExecutionPlan not in __all__"
     print("✓ ExecutionPlan in __all__")
 
     print()
@@ -129,8 +164,7 @@ def test_main_langgraph():
     print("Testing main_langgraph.py")
     print("=" * 70)
 
-    with open("main_langgraph.py", "r") as f:
-        content = f.read()
+    content = read_file("main_langgraph.py")
 
     # Check orchestrator reference removed
     assert "multi_agent_orchestrator" not in content, "Orchestrator reference still in main"
@@ -145,13 +179,11 @@ def test_test_file():
     print("Testing test_langgraph.py")
     print("=" * 70)
 
-    with open("test_langgraph.py", "r") as f:
-        content = f.read()
+    content = read_file("test_langgraph.py")
 
     # Check orchestrator not in expected nodes
-    expected_nodes_section = re.search(r"expected_nodes = \[(.*?)\]", content, re.DOTALL)
-    if expected_nodes_section:
-        nodes_text = expected_nodes_section.group(1)
+    nodes_text = between(content, "expected_nodes = [", "]")
+    if nodes_text is not None:
         assert "multi_agent_orchestrator" not in nodes_text, "Orchestrator in expected nodes"
         print("✓ Orchestrator removed from expected nodes")
 
@@ -164,92 +196,82 @@ def test_documentation():
     print("Testing LANGGRAPH_IMPLEMENTATION.md")
     print("=" * 70)
 
-    with open("LANGGRAPH_IMPLEMENTATION.md", "r") as f:
-        content = f.read()
+    content = read_file("LANGGRAPH_IMPLEMENTATION.md")
 
-    assert "ExecutionPlan" in content, "ExecutionPlan not documented"
+    assert_all(content, _DOC_CHECKS)
     print("✓ ExecutionPlan documented")
-
-    assert "should_continue_sequence" in content, "should_continue_sequence not documented"
     print("✓ should_continue_sequence documented")
-
-    assert "v2.0.0" in content, "Version 2.0.0 not found"
     print("✓ Version 2.0.0 documented")
-
-    assert "Native LangGraph Patterns" in content, "Native patterns not documented"
     print("✓ Native LangGraph patterns documented")
-
-    assert "Phase 2 (Completed)" in content, "Phase 2 not marked complete"
     print("✓ Phase 2 marked as completed")
 
     # Check orchestrator marked as removed
-    assert "multi_agent_orchestrator" in content, "Orchestrator not mentioned"
     assert "Removed" in content or "removed" in content, "Removal not documented"
     print("✓ Orchestrator removal documented")
-
-    # Check statistics updated
-    assert "Nodes:** 10" in content, "Node count not updated"
     print("✓ Node count updated to 10")
 
     print()
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 90)
-    print(" " * 20 + "PHASE 2 REFACTORING VERIFICATION")
-    print("=" * 90)
-    print()
-
-    try:
-        test_types_file()
-        test_nodes_file()
-        test_graph_file()
-        test_init_file()
-        test_main_langgraph()
-        test_test_file()
-        test_documentation()
-
-        print("=" * 90)
-        print(" " * 30 + "ALL TESTS PASSED ✓")
-        print("=" * 90)
-        print()
-        print("Phase 2 Refactoring Complete!")
-        print()
-        print("Summary of Changes:")
-        print("  ✅ ExecutionPlan type added to types.py")
-        print("  ✅ multi_agent_orchestrator_node removed from nodes.py")
-        print("  ✅ should_continue_sequence routing function added")
-        print("  ✅ _execute_agent_node advances execution plan")
-        print("  ✅ supervisor_node initializes execution plan")
-        print("  ✅ Graph updated with agent-to-agent routing")
-        print("  ✅ All imports and exports updated")
-        print("  ✅ Main entry point updated")
-        print("  ✅ Tests updated")
-        print("  ✅ Documentation updated to v2.0.0")
-        print()
-        print("Architecture:")
-        print("  • Sequential multi-agent execution uses native LangGraph patterns")
-        print("  • No dedicated orchestrator node (declarative approach)")
-        print("  • State-based routing via execution_plan")
-        print("  • Each agent can route to next agent in sequence")
-        print("  • Fully compliant with LangGraph best practices")
-        print()
-        print("Next Steps:")
-        print("  1. Test with real questions: python main_langgraph.py")
-        print("  2. Verify sequential multi-agent execution works correctly")
-        print("  3. Check graph visualization shows agent chains")
-        print()
-
-    except AssertionError as e:
+    with buffered_stdout():
         print("\n" + "=" * 90)
-        print(" " * 30 + "TEST FAILED ✗")
+        print(" " * 20 + "PHASE 2 REFACTORING VERIFICATION")
         print("=" * 90)
-        print(f"\nAssertion Error: {e}")
         print()
-    except Exception as e:
-        print("\n" + "=" * 90)
-        print(" " * 30 + "ERROR")
-        print("=" * 90)
-        print(f"\nError: {e}")
-        import traceback
-        traceback.print_exc()
+
+        prefetch(_CHECKED_FILES)
+
+        try:
+            test_types_file()
+            test_nodes_file()
+            test_graph_file()
+            test_init_file()
+            test_main_langgraph()
+            test_test_file()
+            test_documentation()
+
+            print(f"""{'=' * 90}
+{' ' * 30}ALL TESTS PASSED ✓
+{'=' * 90}
+
+Phase 2 Refactoring Complete!
+
+Summary of Changes:
+  ✅ ExecutionPlan type added to types.py
+  ✅ multi_agent_orchestrator_node removed from nodes.py
+  ✅ should_continue_sequence routing function added
+  ✅ _execute_agent_node advances execution plan
+  ✅ supervisor_node initializes execution plan
+  ✅ Graph updated with agent-to-agent routing
+  ✅ All imports and exports updated
+  ✅ Main entry point updated
+  ✅ Tests updated
+  ✅ Documentation updated to v2.0.0
+
+Architecture:
+  • Sequential multi-agent execution uses native LangGraph patterns
+  • No dedicated orchestrator node (declarative approach)
+  • State-based routing via execution_plan
+  • Each agent can route to next agent in sequence
+  • Fully compliant with LangGraph best practices
+
+Next Steps:
+  1. Test with real questions: python main_langgraph.py
+  2. Verify sequential multi-agent execution works correctly
+  3. Check graph visualization shows agent chains
+""")
+
+        except AssertionError as e:
+            print("\n" + "=" * 90)
+            print(" " * 30 + "TEST FAILED ✗")
+            print("=" * 90)
+            print(f"\nAssertion Error: {e}")
+            print()
+        except Exception as e:
+            print("\n" + "=" * 90)
+            print(" " * 30 + "ERROR")
+            print("=" * 90)
+            print(f"\nError: {e}")
+            import traceback
+            traceback.print_exc()
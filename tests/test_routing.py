@@ -5,8 +5,22 @@ Tests routing decisions without calling actual agents (no API costs).
 Validates that questions route to the correct agents with appropriate confidence.
 """
 
-from src.orchestration.router import fast_route, analyze_routing
-from src.orchestration.types import AgentType
+import functools
+import sys
+from heapq import nlargest
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+# Add project root to Python path for direct execution
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.orchestration.router import fast_route, fast_route_batch, analyze_routing
+from src.orchestration.types import AgentType, RouterDecision
+from tests._file_checks import buffered_stdout
 
 # Test cases: (question, expected_agent, should_be_direct)
 TEST_CASES = [
@@ -51,9 +65,54 @@ TEST_CASES = [
     ("Help me with investing", None, False),
 ]
 
+def _freeze(context: Optional[Dict]) -> Optional[Tuple]:
+    """Convert a (possibly nested) context dict into a hashable cache key."""
+    if context is None:
+        return None
+    return tuple(sorted(
+        (key, _freeze(value) if isinstance(value, dict) else value)
+        for key, value in context.items()
+    ))
+
+
+def _thaw(ctx_key: Optional[Tuple]) -> Optional[Dict]:
+    """Rebuild the context dict from a key produced by _freeze."""
+    if ctx_key is None:
+        return None
+    return {
+        key: _thaw(value) if isinstance(value, tuple) else value
+        for key, value in ctx_key
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_route(question: str, ctx_key: Optional[Tuple] = None) -> RouterDecision:
+    """Route a question once per (question, context) pair."""
+    return fast_route(question, _thaw(ctx_key))
+
+
+# analyze_routing results shared across tests
+_cached_analyze = functools.lru_cache(maxsize=128)(analyze_routing)
+
+
+@pytest.mark.parametrize(
+    "question,expected_agent,should_be_direct",
+    TEST_CASES,
+    ids=[question for question, _, _ in TEST_CASES],
+)
+def test_route_case(question, expected_agent, should_be_direct):
+    """Test a single routing case; only a direct route to the wrong agent fails."""
+    decision = _cached_route(question)
+
+    # Supervisor fallbacks and direct routes for ambiguous questions are acceptable
+    if should_be_direct and decision.route == "direct":
+        assert decision.agent == expected_agent, (
+            f"Expected {expected_agent.value}, got {decision.agent.value}"
+        )
+
 
 def test_routing():
-    """Test routing decisions for all test cases."""
+    """Print a routing report for all test cases."""
     print("=" * 70)
     print("🧪 Testing Smart Router + Supervisor")
     print("=" * 70)
@@ -62,11 +121,11 @@ def test_routing():
     passed = 0
     failed = 0
 
-    for question, expected_agent, should_be_direct in TEST_CASES:
-        print(f"Question: \"{question}\"")
+    # Route every question in one batch
+    decisions = fast_route_batch([question for question, _, _ in TEST_CASES])
 
-        # Get routing decision
-        decision = fast_route(question)
+    for (question, expected_agent, should_be_direct), decision in zip(TEST_CASES, decisions):
+        print(f"Question: \"{question}\"")
 
         # Check if routing matches expected
         if should_be_direct:
@@ -128,33 +187,32 @@ def test_detailed_analysis():
     ]
 
     for question in examples:
-        print(f"Question: \"{question}\"")
-        print("-" * 70)
-
-        analysis = analyze_routing(question)
-
-        print("\nRouting Decision:")
-        print(f"  Route: {analysis['decision']['route']}")
-        if analysis['decision']['agent']:
-            print(f"  Agent: {analysis['decision']['agent']}")
-        print(f"  Confidence: {analysis['decision']['confidence']:.2f}")
-        print(f"  Reasoning: {analysis['decision']['reasoning']}")
+        analysis = _cached_analyze(question)
+        decision = analysis['decision']
+
+        parts = [
+            f"Question: \"{question}\"",
+            "-" * 70,
+            "\nRouting Decision:",
+            f"  Route: {decision['route']}",
+        ]
+        if decision['agent']:
+            parts.append(f"  Agent: {decision['agent']}")
+        parts.append(f"  Confidence: {decision['confidence']:.2f}")
+        parts.append(f"  Reasoning: {decision['reasoning']}")
 
         if analysis['pattern_matches']:
-            print("\nPattern Matches:")
+            parts.append("\nPattern Matches:")
             for agent, patterns in analysis['pattern_matches'].items():
-                print(f"  {agent}: {patterns[:2]}")  # Show first 2 patterns
+                parts.append(f"  {agent}: {patterns[:2]}")  # Show first 2 patterns
 
-        print("\nKeyword Scores:")
-        sorted_scores = sorted(
-            analysis['keyword_scores'].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        for agent, score in sorted_scores[:4]:  # Top 4
-            print(f"  {agent}: {score:.2f}")
+        parts.append("\nKeyword Scores:")
+        top_scores = nlargest(4, analysis['keyword_scores'].items(), key=itemgetter(1))
+        for agent, score in top_scores:
+            parts.append(f"  {agent}: {score:.2f}")
 
-        print("\n" + "=" * 70 + "\n")
+        parts.append("\n" + "=" * 70 + "\n")
+        print("\n".join(parts))
 
 
 def test_context_awareness():
@@ -168,7 +226,7 @@ def test_context_awareness():
 
     # Test 1: No context
     print("Test 1: No context provided")
-    decision = fast_route(question)
+    decision = _cached_route(question)
     print(f"  Agent: {decision.agent.value if decision.agent else 'supervisor'}")
     print(f"  Confidence: {decision.confidence:.2f}")
     print()
@@ -180,7 +238,7 @@ def test_context_awareness():
             "has_portfolio": False
         }
     }
-    decision = fast_route(question, context)
+    decision = _cached_route(question, _freeze(context))
     print(f"  Agent: {decision.agent.value if decision.agent else 'supervisor'}")
     print(f"  Confidence: {decision.confidence:.2f}")
     print(f"  Note: Confidence should be lower due to portfolio=False")
@@ -192,7 +250,7 @@ def test_context_awareness():
         "last_agent": "portfolio",
         "user_context": {}
     }
-    decision = fast_route(question, context)
+    decision = _cached_route(question, _freeze(context))
     print(f"  Agent: {decision.agent.value if decision.agent else 'supervisor'}")
     print(f"  Confidence: {decision.confidence:.2f}")
     print(f"  Note: Confidence should be slightly higher due to topic continuity")
@@ -200,20 +258,21 @@ def test_context_awareness():
 
 
 if __name__ == "__main__":
-    # Run all tests
-    test_routing()
-    print("\n\n")
-    test_detailed_analysis()
-    print("\n\n")
-    test_context_awareness()
-
-    print("=" * 70)
-    print("✅ All routing tests completed!")
-    print("=" * 70)
-    print()
-    print("Next Steps:")
-    print("  1. Review routing decisions above")
-    print("  2. Adjust patterns/keywords in router.py if needed")
-    print("  3. Test with real questions: python main.py \"Your question\"")
-    print("  4. Try interactive mode: python main.py")
-    print()
+    with buffered_stdout():
+        # Run all tests
+        test_routing()
+        print("\n\n")
+        test_detailed_analysis()
+        print("\n\n")
+        test_context_awareness()
+
+        print(f"""{'=' * 70}
+✅ All routing tests completed!
+{'=' * 70}
+
+Next Steps:
+  1. Review routing decisions above
+  2. Adjust patterns/keywords in router.py if needed
+  3. Test with real questions: python main.py "Your question"
+  4. Try interactive mode: python main.py
+""")
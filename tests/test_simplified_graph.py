@@ -4,7 +4,44 @@ Test script to verify SIMPLIFIED graph architecture (v2.1).
 Verifies that sequence_router node is added and complexity is reduced.
 """
 
-import re
+import sys
+from pathlib import Path
+
+# Add project root to Python path for direct execution
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests._file_checks import (
+    assert_all,
+    between,
+    buffered_stdout,
+    module_facts,
+    module_symbols,
+    prefetch,
+    read_file,
+)
+
+
+# Project files read by the tests below
+_CHECKED_FILES = (
+    "src/orchestration/nodes.py",
+    "src/orchestration/graph.py",
+    "main_langgraph.py",
+    "test_langgraph.py",
+    "LANGGRAPH_IMPLEMENTATION.md",
+)
+
+# Literals that must appear in each file, with their failure messages
+_GRAPH_CHECKS = [
+    ('"sequence_router": "sequence_router"', "Agents don't route to sequence_router"),
+]
+_DOC_CHECKS = [
+    ("sequence_router", "sequence_router not documented"),
+    ("v2.1", "Version 2.1 not found"),
+    ("SIMPLIFIED", "Simplification not mentioned"),
+    ("Nodes:** 11", "Node count not updated"),
+    ("15 edges", "Edge count not updated"),
+]
 
 
 def test_nodes_file():
@@ -13,22 +50,21 @@ def test_nodes_file():
     print("Testing nodes.py")
     print("=" * 70)
 
-    with open("src/orchestration/nodes.py", "r") as f:
-        content = f.read()
+    symbols = module_symbols("src/orchestration/nodes.py")
 
     # Check sequence_router added
-    assert "def sequence_router_node" in content, "sequence_router_node not found"
+    assert "sequence_router_node" in symbols, "sequence_router_node not found"
     print("✓ sequence_router_node added")
 
     # Check new routing functions
-    assert "def route_after_agent" in content, "route_after_agent not found"
+    assert "route_after_agent" in symbols, "route_after_agent not found"
     print("✓ route_after_agent added")
 
-    assert "def route_sequence" in content, "route_sequence not found"
+    assert "route_sequence" in symbols, "route_sequence not found"
     print("✓ route_sequence added")
 
     # Check old complex function removed
-    assert "def should_continue_sequence" not in content, "should_continue_sequence still exists"
+    assert "should_continue_sequence" not in symbols, "should_continue_sequence still exists"
     print("✓ should_continue_sequence removed (was complex)")
 
     print()
@@ -40,26 +76,19 @@ def test_graph_file():
     print("Testing graph.py")
     print("=" * 70)
 
-    with open("src/orchestration/graph.py", "r") as f:
-        content = f.read()
+    content = read_file("src/orchestration/graph.py")
+    facts = module_facts("src/orchestration/graph.py")
 
-    # Check sequence_router imported
-    assert "sequence_router_node" in content, "sequence_router_node not imported"
+    # Check sequence_router and routing functions are imported and wired up
+    # (agents make a simple 2-way choice to sequence_router or end)
+    for name in ("sequence_router_node", "route_after_agent", "route_sequence"):
+        assert name in facts.imports, f"{name} not imported"
+    assert "sequence_router" in facts.graph_nodes, "sequence_router not added to workflow"
+    assert_all(content, _GRAPH_CHECKS)
     print("✓ sequence_router_node imported")
-
-    # Check new routing functions imported
-    assert "route_after_agent" in content, "route_after_agent not imported"
     print("✓ route_after_agent imported")
-
-    assert "route_sequence" in content, "route_sequence not imported"
     print("✓ route_sequence imported")
-
-    # Check sequence_router added as node
-    assert 'workflow.add_node("sequence_router"' in content, "sequence_router not added to workflow"
     print("✓ sequence_router node added to workflow")
-
-    # Check simplified agent routing (2-way choice)
-    assert '"sequence_router": "sequence_router"' in content, "Agents don't route to sequence_router"
     print("✓ Agents route to sequence_router")
 
     # Check documentation mentions simplification
@@ -67,10 +96,9 @@ def test_graph_file():
     print("✓ Simplification documented")
 
     # Count conditional edge destinations per agent (should be 2: sequence_router and end)
-    agent_edges_pattern = r'route_after_agent.*?\{(.*?)\}'
-    match = re.search(agent_edges_pattern, content, re.DOTALL)
-    if match:
-        edges_dict = match.group(1)
+    agent_edges = content.find("route_after_agent")
+    edges_dict = between(content, "{", "}", agent_edges) if agent_edges >= 0 else None
+    if edges_dict is not None:
         destinations = len([d for d in edges_dict.split('"') if d.strip() and d.strip() != ':'])
         # Should have 2 destinations per agent (sequence_router and end)
         print(f"✓ Agents have ~{destinations//2} routing destinations (was 7 in v2.0)")
@@ -84,8 +112,7 @@ def test_main_langgraph():
     print("Testing main_langgraph.py")
     print("=" * 70)
 
-    with open("main_langgraph.py", "r") as f:
-        content = f.read()
+    content = read_file("main_langgraph.py")
 
     # Check sequence_router progress display
     assert "sequence_router" in content, "sequence_router not handled in main"
@@ -100,13 +127,11 @@ def test_test_file():
     print("Testing test_langgraph.py")
     print("=" * 70)
 
-    with open("test_langgraph.py", "r") as f:
-        content = f.read()
+    content = read_file("test_langgraph.py")
 
     # Check sequence_router in expected nodes
-    expected_nodes_section = re.search(r"expected_nodes = \[(.*?)\]", content, re.DOTALL)
-    if expected_nodes_section:
-        nodes_text = expected_nodes_section.group(1)
+    nodes_text = between(content, "expected_nodes = [", "]")
+    if nodes_text is not None:
         assert "sequence_router" in nodes_text, "sequence_router not in expected nodes"
         print("✓ sequence_router in expected nodes")
 
@@ -123,16 +148,11 @@ def test_documentation():
     print("Testing LANGGRAPH_IMPLEMENTATION.md")
     print("=" * 70)
 
-    with open("LANGGRAPH_IMPLEMENTATION.md", "r") as f:
-        content = f.read()
+    content = read_file("LANGGRAPH_IMPLEMENTATION.md")
 
-    assert "sequence_router" in content, "sequence_router not documented"
+    assert_all(content, _DOC_CHECKS)
     print("✓ sequence_router documented")
-
-    assert "v2.1" in content, "Version 2.1 not found"
     print("✓ Version 2.1 documented")
-
-    assert "SIMPLIFIED" in content, "Simplification not mentioned"
     print("✓ Simplification explained")
 
     # Check it explains the problem
@@ -147,71 +167,71 @@ def test_documentation():
     print("✓ Sequence router in mermaid diagram")
 
     # Check statistics updated
-    assert "Nodes:** 11" in content, "Node count not updated"
     print("✓ Node count is 11")
-
-    assert "15 edges" in content, "Edge count not updated"
     print("✓ Edge count is ~15")
 
     print()
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 90)
-    print(" " * 20 + "SIMPLIFIED GRAPH VERIFICATION (v2.1)")
-    print("=" * 90)
-    print()
-
-    try:
-        test_nodes_file()
-        test_graph_file()
-        test_main_langgraph()
-        test_test_file()
-        test_documentation()
-
-        print("=" * 90)
-        print(" " * 30 + "ALL TESTS PASSED ✓")
-        print("=" * 90)
-        print()
-        print("🎉 Graph Successfully SIMPLIFIED! 🎉")
-        print()
-        print("Summary of v2.1 Changes:")
-        print("  ✅ Added sequence_router node (lightweight, no business logic)")
-        print("  ✅ Added route_after_agent (simple 2-way routing)")
-        print("  ✅ Added route_sequence (determines next agent)")
-        print("  ✅ Removed complex should_continue_sequence")
-        print("  ✅ Reduced from 35+ edges to ~15 edges")
-        print("  ✅ Clean linear flow: Agent → Router → Agent → Router → Synthesizer")
-        print()
-        print("Architecture Comparison:")
-        print("  v1.0: Orchestrator with imperative loops ❌")
-        print("  v2.0: Agent-to-agent mesh (35+ edges) ⚠️")
-        print("  v2.1: Sequence router (15 edges) ✅")
-        print()
-        print("Graph Structure:")
-        print("  11 nodes total:")
-        print("    - 1 fast_router")
-        print("    - 1 supervisor")
-        print("    - 5 agents (education, goal, portfolio, market, news)")
-        print("    - 1 sequence_router ⭐ NEW")
-        print("    - 1 synthesizer")
-        print()
-        print("Next Steps:")
-        print("  1. Test graph creation (needs dependencies)")
-        print("  2. Visualize with /graph command")
-        print("  3. Test multi-agent sequential execution")
-        print()
-
-    except AssertionError as e:
+    with buffered_stdout():
         print("\n" + "=" * 90)
-        print(" " * 30 + "TEST FAILED ✗")
+        print(" " * 20 + "SIMPLIFIED GRAPH VERIFICATION (v2.1)")
         print("=" * 90)
-        print(f"\nAssertion Error: {e}")
         print()
-    except Exception as e:
-        print("\n" + "=" * 90)
-        print(" " * 30 + "ERROR")
-        print("=" * 90)
-        print(f"\nError: {e}")
-        import traceback
-        traceback.print_exc()
+
+        prefetch(_CHECKED_FILES)
+
+        try:
+            test_nodes_file()
+            test_graph_file()
+            test_main_langgraph()
+            test_test_file()
+            test_documentation()
+
+            print(f"""{'=' * 90}
+{' ' * 30}ALL TESTS PASSED ✓
+{'=' * 90}
+
+🎉 Graph Successfully SIMPLIFIED! 🎉
+
+Summary of v2.1 Changes:
+  ✅ Added sequence_router node (lightweight, no business logic)
+  ✅ Added route_after_agent (simple 2-way routing)
+  ✅ Added route_sequence (determines next agent)
+  ✅ Removed complex should_continue_sequence
+  ✅ Reduced from 35+ edges to ~15 edges
+  ✅ Clean linear flow: Agent → Router → Agent → Router → Synthesizer
+
+Architecture Comparison:
+  v1.0: Orchestrator with imperative loops ❌
+  v2.0: Agent-to-agent mesh (35+ edges) ⚠️
+  v2.1: Sequence router (15 edges) ✅
+
+Graph Structure:
+  11 nodes total:
+    - 1 fast_router
+    - 1 supervisor
+    - 5 agents (education, goal, portfolio, market, news)
+    - 1 sequence_router ⭐ NEW
+    - 1 synthesizer
+
+Next Steps:
+  1. Test graph creation (needs dependencies)
+  2. Visualize with /graph command
+  3. Test multi-agent sequential execution
+""")
+
+        except AssertionError as e:
+            print("\n" + "=" * 90)
+            print(" " * 30 + "TEST FAILED ✗")
+            print("=" * 90)
+            print(f"\nAssertion Error: {e}")
+            print()
+        except Exception as e:
+            print("\n" + "=" * 90)
+            print(" " * 30 + "ERROR")
+            print("=" * 90)
+            print(f"\nError: {e}")
+            import traceback
+            traceback.print_exc()
@@ -12,6 +12,7 @@ from src.config import (
     get_openai_api_key,
     get_pinecone_api_key,
     get_config_value,
+    invalidate_env_cache,
     validate_config,
     ConfigError,
     INDEX_NAME,
@@ -22,7 +23,7 @@ from src.config import (
 class TestAPIKeyRetrieval:
     """Test API key getter functions."""
 
-    def test_get_openai_api_key_success(self, mock_env_vars):
+    def test_get_openai_api_key_success(self, isolated_env_vars):
         """Test successful OpenAI API key retrieval."""
         key = get_openai_api_key()
         assert key == "test-openai-key-12345"
@@ -37,7 +38,7 @@ class TestAPIKeyRetrieval:
         assert "OPENAI_API_KEY" in str(exc_info.value)
         assert "not set" in str(exc_info.value)
 
-    def test_get_pinecone_api_key_success(self, mock_env_vars):
+    def test_get_pinecone_api_key_success(self, isolated_env_vars):
         """Test successful Pinecone API key retrieval."""
         key = get_pinecone_api_key()
         assert key == "test-pinecone-key-67890"
@@ -74,33 +75,53 @@ class TestConfigValueRetrieval:
         assert "REQUIRED_KEY" in str(exc_info.value)
         assert "required" in str(exc_info.value).lower()
 
-    def test_get_config_value_existing(self, mock_env_vars):
+    def test_get_config_value_existing(self, isolated_env_vars):
         """Test getting existing config value."""
         value = get_config_value("OPENAI_API_KEY")
         assert value == "test-openai-key-12345"
 
+    def test_get_config_value_cached_until_invalidated(self, monkeypatch):
+        """Test values are cached and re-read after invalidate_env_cache."""
+        monkeypatch.setenv("CACHED_KEY", "first")
+        assert get_config_value("CACHED_KEY") == "first"
+
+        monkeypatch.setenv("CACHED_KEY", "second")
+        assert get_config_value("CACHED_KEY") == "first"
+
+        invalidate_env_cache("CACHED_KEY")
+        assert get_config_value("CACHED_KEY") == "second"
+
+    def test_get_config_value_sees_key_set_after_miss(self, monkeypatch):
+        """Test a key exported after a failed lookup is found without invalidating."""
+        monkeypatch.delenv("LATE_KEY", raising=False)
+        with pytest.raises(ConfigError):
+            get_config_value("LATE_KEY", required=True)
+
+        monkeypatch.setenv("LATE_KEY", "now set")
+        assert get_config_value("LATE_KEY", required=True) == "now set"
+
 
 class TestConfigValidation:
     """Test configuration validation."""
 
-    def test_validate_config_success(self, mock_env_vars):
+    def test_validate_config_success(self, isolated_env_vars):
         """Test successful configuration validation."""
         assert validate_config() is True
 
-    def test_validate_config_missing_openai(self, monkeypatch):
+    def test_validate_config_missing_openai(self, env_sandbox):
         """Test validation fails with missing OpenAI key."""
-        monkeypatch.setenv("PINECONE_API_KEY", "test-key")
-        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        env_sandbox["PINECONE_API_KEY"] = "test-key"
+        env_sandbox.pop("OPENAI_API_KEY", None)
 
         with pytest.raises(ConfigError) as exc_info:
             validate_config()
 
         assert "OPENAI_API_KEY" in str(exc_info.value)
 
-    def test_validate_config_missing_pinecone(self, monkeypatch):
+    def test_validate_config_missing_pinecone(self, env_sandbox):
         """Test validation fails with missing Pinecone key."""
-        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
-        monkeypatch.delenv("PINECONE_API_KEY", raising=False)
+        env_sandbox["OPENAI_API_KEY"] = "test-key"
+        env_sandbox.pop("PINECONE_API_KEY", None)
 
         with pytest.raises(ConfigError) as exc_info:
             validate_config()
@@ -133,46 +154,32 @@ class TestEdgeCases:
         with pytest.raises(ConfigError):
             get_openai_api_key()
 
-    def test_whitespace_api_key(self, monkeypatch):
-        """Test API key with only whitespace."""
-        monkeypatch.setenv("OPENAI_API_KEY", "   \t\n  ")
-
-        # Whitespace-only should be treated as valid (though unusual)
-        # as it's technically a string value
-        key = get_openai_api_key()
-        assert isinstance(key, str)
-
-    def test_very_long_api_key(self, monkeypatch):
-        """Test handling of very long API keys."""
-        long_key = "x" * 10000
-        monkeypatch.setenv("OPENAI_API_KEY", long_key)
-
-        key = get_openai_api_key()
-        assert key == long_key
-        assert len(key) == 10000
-
-    def test_api_key_with_special_characters(self, monkeypatch):
-        """Test API keys with special characters."""
-        special_key = "key-with-$pecial_ch@rs!#%"
-        monkeypatch.setenv("OPENAI_API_KEY", special_key)
-
-        key = get_openai_api_key()
-        assert key == special_key
-
-    def test_unicode_in_config_value(self, monkeypatch):
-        """Test configuration values with unicode characters."""
-        unicode_value = "测试_テスト_🔑"
-        monkeypatch.setenv("TEST_UNICODE", unicode_value)
-
-        value = get_config_value("TEST_UNICODE")
-        assert value == unicode_value
-
-    def test_config_value_type_coercion(self, monkeypatch):
-        """Test that numeric strings are returned as strings."""
-        monkeypatch.setenv("NUMERIC_CONFIG", "12345")
-
-        value = get_config_value("NUMERIC_CONFIG")
-        assert value == "12345"
+    @pytest.mark.parametrize(
+        "api_key",
+        [
+            "   \t\n  ",  # Whitespace-only is unusual but still a set value
+            "x" * 10000,
+            "key-with-$pecial_ch@rs!#%",
+        ],
+        ids=["whitespace", "very_long", "special_characters"],
+    )
+    def test_api_key_round_trip(self, monkeypatch, api_key):
+        """Test unusual but non-empty API keys are returned unchanged."""
+        monkeypatch.setenv("OPENAI_API_KEY", api_key)
+
+        assert get_openai_api_key() == api_key
+
+    @pytest.mark.parametrize(
+        "config_value",
+        ["测试_テスト_🔑", "12345"],
+        ids=["unicode", "numeric_string"],
+    )
+    def test_config_value_round_trip(self, monkeypatch, config_value):
+        """Test config values are returned as the exact string set, without coercion."""
+        monkeypatch.setenv("TEST_CONFIG_VALUE", config_value)
+
+        value = get_config_value("TEST_CONFIG_VALUE")
+        assert value == config_value
         assert isinstance(value, str)
 
     def test_none_vs_empty_string(self, clear_env_vars):
@@ -0,0 +1,193 @@
+"""
+Unit tests for src/utils/context_manager.py
+
+Tests context window management including:
+- Message format conversion
+- Conversation trimming
+- Token estimation and context summaries
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, SystemMessage
+
+from src.utils import context_manager
+from src.utils.context_manager import (
+    convert_to_dict_messages,
+    dict_to_langchain_message,
+    langchain_to_dict_message,
+    trim_conversation_history,
+    estimate_token_count,
+    get_context_summary,
+)
+
+
+@pytest.fixture
+def dict_conversation():
+    """Five-message conversation in dict format."""
+    return [
+        {"role": "user", "content": "Q1"},
+        {"role": "assistant", "content": "A1"},
+        {"role": "user", "content": "Q2"},
+        {"role": "assistant", "content": "A2"},
+        {"role": "user", "content": "Q3"},
+    ]
+
+
+@pytest.fixture
+def langchain_conversation():
+    """Three-message conversation as LangChain message objects."""
+    return [
+        HumanMessage(content="Hello"),
+        AIMessage(content="Hi there!"),
+        HumanMessage(content="How are you?"),
+    ]
+
+
+class TestConversion:
+    """Test message format conversion."""
+
+    def test_convert_langchain_messages(self, langchain_conversation):
+        """Test LangChain messages are converted to role/content dicts."""
+        result = convert_to_dict_messages(langchain_conversation)
+
+        assert result == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "How are you?"},
+        ]
+
+    def test_message_roles(self):
+        """Test chunk classes map to their role and other messages to system."""
+        assert langchain_to_dict_message(AIMessageChunk(content="Hi"))["role"] == "assistant"
+        assert langchain_to_dict_message(SystemMessage(content="Be brief"))["role"] == "system"
+
+    def test_message_subclass_roles(self):
+        """Test subclasses of HumanMessage/AIMessage keep their parent's role."""
+        class TaggedHumanMessage(HumanMessage):
+            pass
+
+        class TaggedAIMessage(AIMessage):
+            pass
+
+        assert langchain_to_dict_message(TaggedHumanMessage(content="Q"))["role"] == "user"
+        assert langchain_to_dict_message(TaggedAIMessage(content="A"))["role"] == "assistant"
+
+    def test_unknown_role_becomes_human_message(self):
+        """Test dicts with an unknown role convert to HumanMessage."""
+        msg = dict_to_langchain_message({"role": "tool", "content": "42"})
+
+        assert type(msg) is HumanMessage
+        assert msg.content == "42"
+
+
+class TestTrimConversationHistory:
+    """Test conversation trimming."""
+
+    def test_trim_keeps_last_messages(self, dict_conversation):
+        """Test that trimming keeps the most recent messages."""
+        trimmed = trim_conversation_history(dict_conversation, max_messages=3)
+
+        assert len(trimmed) == 3
+        assert trimmed[0]["content"] == "Q2"
+
+    def test_trim_langchain_messages(self, langchain_conversation):
+        """Test that LangChain messages are converted before trimming."""
+        trimmed = trim_conversation_history(langchain_conversation, max_messages=2)
+
+        assert trimmed == [
+            {"role": "assistant", "content": "Hi there!"},
+            {"role": "user", "content": "How are you?"},
+        ]
+
+    def test_trim_returns_dict_input_unchanged(self, dict_conversation):
+        """Test dict history under the limit is returned without copying."""
+        trimmed = trim_conversation_history(dict_conversation, max_messages=10)
+
+        assert trimmed is dict_conversation
+
+    def test_trim_converts_mixed_formats(self):
+        """Test a dict-first list that also holds LangChain messages comes back as dicts."""
+        messages = [{"role": "user", "content": "Q1"}, AIMessage(content="A1")]
+
+        assert trim_conversation_history(messages) == [
+            {"role": "user", "content": "Q1"},
+            {"role": "assistant", "content": "A1"},
+        ]
+
+    def test_trim_empty_history(self):
+        """Test trimming an empty history."""
+        assert trim_conversation_history([]) == []
+
+
+class TestTokenEstimation:
+    """Test token estimation and context summaries."""
+
+    def test_estimate_matches_for_both_formats(self, langchain_conversation):
+        """Test dict and LangChain inputs produce the same estimate."""
+        dict_messages = convert_to_dict_messages(langchain_conversation)
+
+        assert estimate_token_count(langchain_conversation) == estimate_token_count(dict_messages)
+
+    def test_estimate_uses_token_encoding(self, monkeypatch, dict_conversation):
+        """Test exact counts come from the encoder plus per-message overhead."""
+        fake_encoding = MagicMock()
+        fake_encoding.encode_batch.side_effect = lambda texts, num_threads, disallowed_special: [
+            [0] * len(text) for text in texts
+        ]
+        monkeypatch.setattr(context_manager, "_get_token_encoding", lambda: fake_encoding)
+
+        # Five 2-character messages + 3 tokens overhead each
+        assert estimate_token_count(dict_conversation) == 5 * 2 + 5 * 3
+
+    def test_estimate_counts_special_tokens_as_text(self, monkeypatch):
+        """Test user text containing special-token markers is counted, not rejected."""
+        def encode_batch(texts, num_threads, disallowed_special="all"):
+            # tiktoken raises on special-token text unless it is allowed
+            if disallowed_special and any("<|endoftext|>" in text for text in texts):
+                raise ValueError("Encountered text corresponding to disallowed special token")
+            return [[0] * len(text) for text in texts]
+
+        fake_encoding = MagicMock()
+        fake_encoding.encode_batch.side_effect = encode_batch
+        monkeypatch.setattr(context_manager, "_get_token_encoding", lambda: fake_encoding)
+
+        messages = [{"role": "user", "content": "<|endoftext|>"}]
+        assert estimate_token_count(messages) == len("<|endoftext|>") + 3
+
+    def test_estimate_uses_text_of_multimodal_content(self, monkeypatch):
+        """Test list content is counted by its text parts."""
+        fake_encoding = MagicMock()
+        fake_encoding.encode_batch.side_effect = lambda texts, num_threads, disallowed_special: [
+            [0] * len(text) for text in texts
+        ]
+        monkeypatch.setattr(context_manager, "_get_token_encoding", lambda: fake_encoding)
+
+        messages = [{"role": "user", "content": [
+            "ab",
+            {"type": "text", "text": "cd"},
+            {"type": "image_url", "image_url": {"url": "https://example.com/chart.png"}},
+        ]}]
+        assert estimate_token_count(messages) == 4 + 3
+
+    def test_character_estimate_handles_multimodal_content(self, monkeypatch):
+        """Test the fallback joins the text of list content instead of raising TypeError."""
+        monkeypatch.setattr(context_manager, "_get_token_encoding", lambda: None)
+
+        messages = [
+            {"role": "user", "content": "x" * 40},
+            {"role": "user", "content": [{"type": "text", "text": "y" * 40}]},
+        ]
+        assert estimate_token_count(messages) == context_manager._chars_to_tokens(80)
+
+    def test_context_summary_counts(self, langchain_conversation):
+        """Test summary reports message, turn and role counts."""
+        summary = get_context_summary(langchain_conversation)
+
+        assert summary.startswith("3 messages (1 turns)")
+        assert f"~{estimate_token_count(langchain_conversation)} tokens" in summary
+        assert summary.endswith("2 user, 1 assistant")
+
+    def test_context_summary_empty(self):
+        """Test summary of an empty conversation."""
+        assert get_context_summary([]) == "Empty conversation"
@@ -0,0 +1,341 @@
+"""
+Unit tests for src/rag/ingestion.py
+
+Tests ingestion helpers including:
+- PDF loading
+- Chunk cache keys
+- Threaded pipeline stages
+- Embedding batch construction
+- Content-hash vector IDs
+- Embedding backend selection
+- Pinecone index setup
+"""
+
+import sys
+import threading
+import pytest
+from unittest.mock import MagicMock
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, StreamObject
+
+from src.rag import ingestion
+from src.rag.ingestion import (
+    _batched_ranges,
+    _chunk_cache_key,
+    _chunk_id,
+    _embed_and_upsert,
+    _embed_texts,
+    _is_image_only_page,
+    _iter_parsed_pdfs,
+    _load_one_pdf,
+    _threaded,
+)
+
+
+@pytest.fixture
+def blank_pdf(temp_dir):
+    """Create a two-page PDF with no text."""
+    file_path = temp_dir / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    writer.add_blank_page(width=72, height=72)
+    with file_path.open("wb") as f:
+        writer.write(f)
+    return file_path
+
+
+class TestPdfLoading:
+    """Test memory-mapped PDF loading."""
+
+    def test_load_one_pdf_returns_page_documents(self, blank_pdf):
+        """Test each page becomes a Document with source and page metadata."""
+        docs = _load_one_pdf(blank_pdf)
+
+        assert [doc.metadata for doc in docs] == [
+            {"source": str(blank_pdf), "page": 0},
+            {"source": str(blank_pdf), "page": 1},
+        ]
+
+    def test_image_only_page_detected(self):
+        """Test a page drawing only an image XObject, with no fonts, is skipped."""
+        page = PdfWriter().add_blank_page(width=72, height=72)
+        image = StreamObject()
+        image[NameObject("/Subtype")] = NameObject("/Image")
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): image})
+        })
+
+        assert _is_image_only_page(page)
+
+        page[NameObject("/Resources")][NameObject("/Font")] = DictionaryObject()
+        assert not _is_image_only_page(page)
+
+    def test_load_one_pdf_empty_file(self, temp_dir):
+        """Test a zero-byte file yields no documents instead of failing to mmap."""
+        empty_pdf = temp_dir / "empty.pdf"
+        empty_pdf.touch()
+
+        assert _load_one_pdf(empty_pdf) == []
+
+    def test_parse_folder_without_pdfs(self, temp_dir):
+        """Test a folder without PDFs yields nothing."""
+        assert list(_iter_parsed_pdfs(str(temp_dir))) == []
+
+    def test_parse_in_pipeline_thread(self, blank_pdf, temp_dir):
+        """Test spawned worker processes parse PDFs for a background pipeline stage."""
+        parsed = list(_threaded(_iter_parsed_pdfs(str(temp_dir))))
+
+        assert [[doc.metadata["page"] for doc in pages] for pages in parsed] == [[0, 1]]
+
+
+class TestChunkCacheKey:
+    """Test the key of the on-disk chunk cache."""
+
+    def test_hidden_pdfs_do_not_change_key(self, blank_pdf, temp_dir):
+        """Test PDFs the loader skips do not invalidate the cache."""
+        key = _chunk_cache_key(str(temp_dir), 300, 100)
+        (temp_dir / ".hidden.pdf").write_bytes(blank_pdf.read_bytes())
+
+        assert _chunk_cache_key(str(temp_dir), 300, 100) == key
+
+    def test_key_includes_cache_version(self, monkeypatch, blank_pdf, temp_dir):
+        """Test bumping CHUNK_CACHE_VERSION invalidates cached chunks."""
+        key = _chunk_cache_key(str(temp_dir), 300, 100)
+        monkeypatch.setattr(ingestion, "CHUNK_CACHE_VERSION", ingestion.CHUNK_CACHE_VERSION + 1)
+
+        assert _chunk_cache_key(str(temp_dir), 300, 100) != key
+
+
+class TestPipelineStage:
+    """Test threaded pipeline stages."""
+
+    def test_threaded_preserves_order(self):
+        """Test items come through the bounded queue in order."""
+        assert list(_threaded(iter(range(10)), maxsize=2)) == list(range(10))
+
+    def test_threaded_reraises_producer_error(self):
+        """Test a failure in the background stage surfaces in the consumer."""
+        def failing():
+            yield 1
+            raise RuntimeError("parse failed")
+
+        stage = _threaded(failing())
+
+        assert next(stage) == 1
+        with pytest.raises(RuntimeError, match="parse failed"):
+            next(stage)
+
+    def test_closing_consumer_stops_producer(self):
+        """Test a consumer that stops early releases the producer and closes its source."""
+        source_closed = threading.Event()
+
+        def endless():
+            try:
+                while True:
+                    yield 1
+            finally:
+                source_closed.set()
+
+        stage = _threaded(endless(), maxsize=1)
+        assert next(stage) == 1
+        stage.close()
+
+        assert source_closed.wait(timeout=5)
+
+
+class TestEmbeddingBatches:
+    """Test batched embedding of document texts."""
+
+    def test_batched_ranges_respects_batch_size(self):
+        """Test ranges close once batch_size texts are collected."""
+        texts = ["text"] * 5
+
+        assert list(_batched_ranges(texts, batch_size=2)) == [(0, 2), (2, 4), (4, 5)]
+
+    def test_batched_ranges_respects_token_budget(self):
+        """Test ranges close before exceeding the token budget."""
+        # Each text is ~26 tokens, so only one fits under a 30 token budget
+        texts = ["x" * 100] * 3
+
+        assert list(_batched_ranges(texts, batch_size=10, max_tokens=30)) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_embed_texts_preserves_input_order(self):
+        """Test vectors line up with inputs even though batches are length-sorted."""
+        embeddings = MagicMock()
+        embeddings.embed_documents.side_effect = lambda batch: [[float(len(t))] for t in batch]
+
+        vectors = _embed_texts(["ccc", "a", "bb"], embeddings)
+
+        assert vectors == [[3.0], [1.0], [2.0]]
+
+
+class TestEmbedAndUpsert:
+    """Test content-hash IDs and skipping of stored chunks."""
+
+    @pytest.fixture
+    def embeddings(self):
+        """Embeddings mock returning one vector per text."""
+        mock = MagicMock()
+        mock.embed_documents.side_effect = lambda batch: [[0.1] for _ in batch]
+        return mock
+
+    def test_ids_are_content_hashes(self, mock_documents, embeddings):
+        """Test vectors are upserted under IDs derived from chunk text."""
+        index = MagicMock()
+
+        _embed_and_upsert(index, mock_documents, embeddings)
+
+        vectors = index.upsert.call_args.kwargs["vectors"]
+        assert [v[0] for v in vectors] == [_chunk_id(d.page_content) for d in mock_documents]
+        index.fetch.assert_not_called()
+
+    def test_upserts_full_batches(self, embeddings):
+        """Test vectors from several embedding groups are sent in full batches."""
+        index = MagicMock()
+        documents = [MagicMock(page_content=f"chunk {i}", metadata={}) for i in range(250)]
+
+        upserted = _embed_and_upsert(index, documents, embeddings, batch_size=100)
+
+        assert upserted == 250
+        assert [len(c.kwargs["vectors"]) for c in index.upsert.call_args_list] == [100, 100, 50]
+
+    def test_skip_existing_only_embeds_new_chunks(self, mock_documents, embeddings):
+        """Test chunks already in the index are not embedded again."""
+        index = MagicMock()
+        stored = {_chunk_id(d.page_content): {} for d in mock_documents[:3]}
+        index.fetch.return_value.vectors = stored
+
+        upserted = _embed_and_upsert(index, mock_documents, embeddings, skip_existing=True)
+
+        assert upserted == 2
+        embedded = [t for call in embeddings.embed_documents.call_args_list for t in call.args[0]]
+        assert sorted(embedded) == sorted(d.page_content for d in mock_documents[3:])
+
+
+class TestEmbeddingBackend:
+    """Test embedding backend selection."""
+
+    def test_openai_backend_is_default(self, monkeypatch, mock_openai_embeddings):
+        """Test the OpenAI embeddings are used unless the onnx backend is selected."""
+        monkeypatch.setattr(ingestion, "EMBEDDING_BACKEND", "openai")
+        monkeypatch.setattr(ingestion, "_get_openai_embeddings", lambda: mock_openai_embeddings)
+
+        assert ingestion._get_embeddings() is mock_openai_embeddings
+
+    def test_onnx_backend_requires_optional_dependencies(self, monkeypatch):
+        """Test a clear ImportError when optimum is not installed."""
+        monkeypatch.setattr(ingestion, "EMBEDDING_BACKEND", "onnx")
+        monkeypatch.setitem(sys.modules, "optimum.onnxruntime", None)
+
+        with pytest.raises(ImportError, match="optimum"):
+            ingestion._get_embeddings()
+
+
+def _failing_documents():
+    """Document stream whose first PDF fails to parse."""
+    raise RuntimeError("parse failed")
+    yield
+
+
+class TestSaveEmbeddings:
+    """Test Pinecone control-plane calls made by save_embeddings."""
+
+    @pytest.fixture
+    def patched_ingestion(self, monkeypatch, mock_pinecone_client, mock_openai_embeddings):
+        """Patch clients, upserts and the vector store used by save_embeddings."""
+        monkeypatch.setattr(ingestion, "_get_pinecone_client", lambda: mock_pinecone_client)
+        monkeypatch.setattr(ingestion, "_get_embeddings", lambda: mock_openai_embeddings)
+        monkeypatch.setattr(ingestion, "_embed_and_upsert", MagicMock(return_value=5))
+        monkeypatch.setattr(ingestion, "PineconeVectorStore", MagicMock())
+        return mock_pinecone_client
+
+    def test_new_index_skips_stats_by_default(self, patched_ingestion, mock_documents):
+        """Test a fresh index is listed once and stats are not fetched."""
+        ingestion.save_embeddings(mock_documents)
+
+        patched_ingestion.list_indexes.assert_called_once()
+        patched_ingestion.create_index.assert_called_once()
+        patched_ingestion.Index.return_value.describe_index_stats.assert_not_called()
+
+    def test_verify_fetches_stats(self, patched_ingestion, mock_documents):
+        """Test verify=True reports the stored vector count from index stats."""
+        ingestion.save_embeddings(mock_documents, verify=True)
+
+        patched_ingestion.Index.return_value.describe_index_stats.assert_called_once()
+
+    @pytest.mark.parametrize("stored_id, reusable", [
+        (_chunk_id("stored chunk"), True),
+        ("3f2b8c1e-9a4d-4e7b-8c2a-1d5e6f7a8b9c", False),
+    ])
+    def test_incremental_requires_content_hash_ids(
+        self, monkeypatch, patched_ingestion, mock_documents, stored_id, reusable
+    ):
+        """Test incremental indexing refuses an index whose IDs are not chunk hashes."""
+        index = MagicMock()
+        index.list_paginated.return_value.vectors = [MagicMock(id=stored_id)]
+        monkeypatch.setattr(ingestion, "_index_state", lambda pc, pool_threads: (index, 10, 1536))
+
+        if reusable:
+            ingestion.save_embeddings(mock_documents, incremental=True)
+            assert ingestion._embed_and_upsert.call_args.kwargs["skip_existing"]
+        else:
+            with pytest.raises(ValueError, match="force_reindex"):
+                ingestion.save_embeddings(mock_documents, incremental=True)
+            ingestion._embed_and_upsert.assert_not_called()
+
+    @pytest.mark.parametrize("make_documents, error", [
+        (lambda: iter([]), ValueError),
+        (_failing_documents, RuntimeError),
+    ], ids=["empty", "parse-error"])
+    def test_force_reindex_keeps_index_without_documents(
+        self, monkeypatch, patched_ingestion, make_documents, error
+    ):
+        """Test the existing index is not deleted when no document can be produced."""
+        monkeypatch.setattr(ingestion, "_index_state", lambda pc, pool_threads: (MagicMock(), 10, 1536))
+
+        with pytest.raises(error):
+            ingestion.save_embeddings(make_documents(), force_reindex=True)
+
+        patched_ingestion.delete_index.assert_not_called()
+
+    def test_dimension_mismatch_fails_before_embedding(
+        self, monkeypatch, patched_ingestion, mock_documents
+    ):
+        """Test a backend whose vectors do not fit the existing index is rejected up front."""
+        monkeypatch.setattr(ingestion, "_index_state", lambda pc, pool_threads: (MagicMock(), 0, 384))
+
+        with pytest.raises(ValueError, match="384-dimensional"):
+            ingestion.save_embeddings(mock_documents)
+
+        ingestion._embed_and_upsert.assert_not_called()
+
+    def test_setup_looks_up_empty_index_once(self, monkeypatch, patched_ingestion, mock_documents):
+        """Test setup_finance_rag passes the index state on instead of fetching it again."""
+        existing = MagicMock()
+        existing.name = ingestion.INDEX_NAME
+        monkeypatch.setattr(patched_ingestion, "list_indexes", MagicMock(return_value=[existing]))
+        monkeypatch.setattr(ingestion, "_iter_document_chunks", lambda folder_path: iter([mock_documents]))
+
+        ingestion.setup_finance_rag("unused")
+
+        patched_ingestion.list_indexes.assert_called_once()
+        patched_ingestion.Index.return_value.describe_index_stats.assert_called_once()
+        patched_ingestion.create_index.assert_not_called()
+
+    def test_setup_surfaces_upsert_failure(self, monkeypatch):
+        """Test an upsert failing mid-stream raises its own error, not a pipeline teardown error."""
+        pc = MagicMock()
+        pc.Index.return_value.upsert.side_effect = RuntimeError("pinecone down")
+        embeddings = MagicMock()
+        embeddings.embed_documents.side_effect = lambda batch: [[0.1] for _ in batch]
+        files = [
+            [MagicMock(page_content=f"file {f} chunk {i}", metadata={}) for i in range(10)]
+            for f in range(29)
+        ]
+        monkeypatch.setattr(ingestion, "_get_pinecone_client", lambda: pc)
+        monkeypatch.setattr(ingestion, "_get_embeddings", lambda: embeddings)
+        monkeypatch.setattr(ingestion, "_index_state", lambda pc, pool_threads=None: (None, 0, None))
+        monkeypatch.setattr(ingestion, "_iter_document_chunks", lambda folder_path: iter(files))
+
+        with pytest.raises(RuntimeError, match="pinecone down"):
+            ingestion.setup_finance_rag("unused")
@@ -0,0 +1,44 @@
+"""
+Unit tests for src/rag/local_embeddings.py
+
+Tests local ONNX embedding setup including:
+- Quantization preset selection for the host CPU
+- Model cache location
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.config import PROJECT_ROOT
+from src.rag import local_embeddings
+from src.rag.local_embeddings import _quantization_target
+
+
+class TestQuantizationTarget:
+    """Test the INT8 quantization preset is chosen from the host CPU."""
+
+    @pytest.mark.parametrize("machine, flags, expected", [
+        ("x86_64", {"avx2", "avx512f", "avx512_vnni"}, "avx512_vnni"),
+        ("x86_64", {"avx2", "avx512f"}, "avx512"),
+        ("x86_64", {"avx2"}, "avx2"),
+        ("AMD64", set(), "avx2"),
+        ("aarch64", set(), "arm64"),
+        ("arm64", set(), "arm64"),
+    ])
+    def test_preset_matches_cpu(self, monkeypatch, machine, flags, expected):
+        """Test ARM hosts get arm64 and x86 hosts the best preset their flags allow."""
+        monkeypatch.setattr(local_embeddings.platform, "machine", lambda: machine)
+        monkeypatch.setattr(local_embeddings, "_cpu_flags", lambda: flags)
+
+        assert _quantization_target() == expected
+
+
+class TestModelCache:
+    """Test where exported models are stored."""
+
+    @pytest.mark.skipif("ONNX_CACHE_DIR" in os.environ, reason="ONNX_CACHE_DIR is set")
+    def test_default_cache_is_in_project_root(self):
+        """Test the default cache does not depend on the working directory."""
+        assert local_embeddings.ONNX_CACHE_DIR == Path(PROJECT_ROOT) / ".onnx_models"
@@ -108,6 +108,13 @@ class TestFormatPrompt:
 
         assert result == "Hello Alice"
 
+    def test_format_matches_str_format(self):
+        """Test escaped braces, format specs, conversions and attribute fields."""
+        template = "{{literal}} {name!r} {price:.2f} {price.real} {n:{width}}"
+        kwargs = {"name": "Alice", "price": 9.5, "n": 7, "width": 4}
+
+        assert format_prompt(template, **kwargs) == template.format(**kwargs)
+
 
 @pytest.mark.edge_case
 class TestPromptEdgeCases:
@@ -133,61 +140,45 @@ class TestPromptEdgeCases:
         with pytest.raises(ValueError):
             get_prompt("FINANCIAL_ASSISTANT")
 
-    def test_format_empty_template(self):
-        """Test formatting an empty template."""
-        result = format_prompt("", name="Alice")
-
-        assert result == ""
-
-    def test_format_with_special_characters(self):
-        """Test template with special characters."""
-        template = "Email: {email}, Cost: ${price}"
-        result = format_prompt(template, email="test@example.com", price="99.99")
-
-        assert result == "Email: test@example.com, Cost: $99.99"
-
-    def test_format_with_unicode(self):
-        """Test template formatting with unicode characters."""
-        template = "User: {name}, Message: {msg}"
-        result = format_prompt(template, name="José", msg="Hello! 👋")
-
-        assert "José" in result
-        assert "👋" in result
-
-    def test_format_with_newlines(self):
-        """Test template with newline characters."""
-        template = "Line 1: {line1}\nLine 2: {line2}"
-        result = format_prompt(template, line1="First", line2="Second")
-
-        assert "Line 1: First" in result
-        assert "Line 2: Second" in result
-        assert "\n" in result
-
-    def test_format_with_very_long_values(self):
-        """Test formatting with very long values."""
-        template = "Content: {content}"
-        long_content = "x" * 10000
-        result = format_prompt(template, content=long_content)
-
-        assert len(result) > 10000
-        assert long_content in result
+    @pytest.mark.parametrize(
+        "template,kwargs,expected",
+        [
+            ("", {"name": "Alice"}, ""),
+            (
+                "Email: {email}, Cost: ${price}",
+                {"email": "test@example.com", "price": "99.99"},
+                "Email: test@example.com, Cost: $99.99",
+            ),
+            (
+                "User: {name}, Message: {msg}",
+                {"name": "José", "msg": "Hello! 👋"},
+                "User: José, Message: Hello! 👋",
+            ),
+            (
+                "Line 1: {line1}\nLine 2: {line2}",
+                {"line1": "First", "line2": "Second"},
+                "Line 1: First\nLine 2: Second",
+            ),
+            ("Content: {content}", {"content": "x" * 10000}, "Content: " + "x" * 10000),
+            (
+                "Count: {count}, Price: {price}, Active: {active}",
+                {"count": 42, "price": 99.99, "active": True},
+                "Count: 42, Price: 99.99, Active: True",
+            ),
+        ],
+        ids=["empty_template", "special_characters", "unicode", "newlines", "very_long_value", "numeric_values"],
+    )
+    def test_format_variants(self, template, kwargs, expected):
+        """Test formatting templates and values with unusual content."""
+        assert format_prompt(template, **kwargs) == expected
 
     def test_prompt_immutability(self):
-        """Test that getting a prompt doesn't modify the original."""
+        """Test that repeated lookups return the same unchanged prompt."""
         original = get_prompt("financial_assistant")
         retrieved = get_prompt("financial_assistant")
 
         assert original == retrieved
-        assert original is not retrieved  # Different objects
-
-    def test_format_with_numeric_values(self):
-        """Test template formatting with numeric types."""
-        template = "Count: {count}, Price: {price}, Active: {active}"
-        result = format_prompt(template, count=42, price=99.99, active=True)
-
-        assert "42" in result
-        assert "99.99" in result
-        assert "True" in result
+        assert original is retrieved  # Cached; str is immutable so sharing is safe
 
     def test_format_with_nested_braces(self):
         """Test template with nested braces."""
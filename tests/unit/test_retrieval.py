@@ -0,0 +1,153 @@
+"""
+Unit tests for src/rag/retrieval_and_generation.py
+
+Tests document retrieval including:
+- Serialization of retrieved documents
+- Batch retrieval for multiple queries
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.documents import Document
+
+from src.rag import retrieval_and_generation
+from src.rag.retrieval_and_generation import (
+    retrieve_relevant_documents,
+    retrieve_batch,
+    retrieve_batch_async,
+    retrieve_batch_tool,
+)
+
+
+class _SessionVectorStore:
+    """
+    Vector store double that mimics PineconeVectorStore's async index context.
+
+    Outside ``async with`` each search opens and closes its own session, so
+    overlapping searches would close a session another search still uses.
+    Entering an already open context is a no-op, and leaving closes it.
+    """
+
+    def __init__(self):
+        self.session = None
+        self.sessions_opened = 0
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = object()
+            self.sessions_opened += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.session = None
+
+    async def asimilarity_search(self, query, k):
+        owns_session = self.session is None
+        if owns_session:
+            await self.__aenter__()
+        session = self.session
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        if self.session is not session:
+            raise RuntimeError("Session is closed")
+        if owns_session:
+            await self.__aexit__(None, None, None)
+        return [Document(page_content=query)]
+
+
+class TestRetrieveRelevantDocuments:
+    """Test single-query retrieval."""
+
+    def test_serializes_metadata_as_json(self, monkeypatch, mock_vectorstore):
+        """Test each document is rendered as compact JSON metadata plus content."""
+        monkeypatch.setattr(retrieval_and_generation, "_vs", lambda: mock_vectorstore)
+
+        result = retrieve_relevant_documents("How do I budget?", k=1)
+
+        assert result == (
+            'Source: {"source":"test.pdf","page":1}\n'
+            "Content: Sample financial content about budgeting"
+        )
+
+
+class TestRetrieveBatch:
+    """Test concurrent retrieval for several queries."""
+
+    @pytest.fixture
+    def echo_vectorstore(self, monkeypatch, mock_vectorstore):
+        """Vector store whose sync search returns the query as the only document."""
+        monkeypatch.setattr(
+            mock_vectorstore,
+            "similarity_search",
+            MagicMock(side_effect=lambda query, k: [Document(page_content=query)]),
+        )
+        monkeypatch.setattr(retrieval_and_generation, "_vs", lambda: mock_vectorstore)
+        return mock_vectorstore
+
+    def test_results_follow_query_order(self, echo_vectorstore):
+        """Test each query gets its own results, in input order."""
+        results = retrieve_batch(["What is an ETF?", "What is a bond?"], k=1)
+
+        assert results == [
+            "Source: {}\nContent: What is an ETF?",
+            "Source: {}\nContent: What is a bond?",
+        ]
+
+    def test_works_inside_running_event_loop(self, echo_vectorstore):
+        """Test the sync batch can be called from a thread whose event loop is running."""
+        async def call_from_async_code():
+            return retrieve_batch(["What is an ETF?"], k=1)
+
+        assert asyncio.run(call_from_async_code()) == ["Source: {}\nContent: What is an ETF?"]
+
+    def test_async_queries_share_one_session(self, monkeypatch):
+        """Test concurrent queries run in one async index context that stays open."""
+        vectorstore = _SessionVectorStore()
+        monkeypatch.setattr(retrieval_and_generation, "_batch_vs", lambda: vectorstore)
+        queries = ["What is an ETF?", "What is a bond?", "What is a CD?"]
+
+        results = asyncio.run(retrieve_batch_async(queries, k=1))
+
+        assert results == [f"Source: {{}}\nContent: {query}" for query in queries]
+        assert vectorstore.sessions_opened == 1
+        assert vectorstore.session is None
+
+    def test_concurrent_async_batches_use_separate_contexts(self, monkeypatch):
+        """Test overlapping batches do not close each other's async index context."""
+        stores = []
+
+        def new_store():
+            stores.append(_SessionVectorStore())
+            return stores[-1]
+
+        monkeypatch.setattr(retrieval_and_generation, "_batch_vs", new_store)
+
+        async def later_batch():
+            # Start while the first batch's searches are in flight, so they
+            # finish (and a shared context would close) before these do
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return await retrieve_batch_async(["What is a CD?", "What is a REIT?"], k=1)
+
+        async def two_batches():
+            return await asyncio.gather(
+                retrieve_batch_async(["What is an ETF?", "What is a bond?"], k=1),
+                later_batch(),
+            )
+
+        first, second = asyncio.run(two_batches())
+
+        assert second == ["Source: {}\nContent: What is a CD?", "Source: {}\nContent: What is a REIT?"]
+        assert [store.sessions_opened for store in stores] == [1, 1]
+
+    def test_empty_batch(self):
+        """Test no queries returns no results without touching the vector store."""
+        assert retrieve_batch([]) == []
+
+    def test_tool_rejects_invalid_json(self):
+        """Test the batch tool reports input that is not a JSON list of strings."""
+        assert retrieve_batch_tool.invoke({"queries": "not json"}).startswith("Error")
+        assert retrieve_batch_tool.invoke({"queries": json.dumps({"q": 1})}).startswith("Error")
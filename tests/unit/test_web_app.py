@@ -0,0 +1,30 @@
+"""
+Unit tests for web_app/app.py
+
+Tests the web UI's LangGraph app singleton including:
+- Injecting a prebuilt app
+- Reusing the singleton across calls
+"""
+
+import pytest
+
+from web_app import app as web_app
+
+
+@pytest.fixture
+def fresh_singleton(monkeypatch):
+    """Start without an app singleton and restore the previous one afterwards."""
+    monkeypatch.setattr(web_app, "_app", None)
+
+
+class TestGetApp:
+    """Test the LangGraph app singleton used by the chat handler."""
+
+    def test_injected_app_becomes_singleton(self, fresh_singleton, finance_app):
+        """Test an injected app is returned now and by later calls without arguments."""
+        assert web_app.get_app(finance_app) is finance_app
+        assert web_app.get_app() is finance_app
+
+    def test_shared_app_has_memory(self, finance_app):
+        """Test the session app keeps conversation state between turns."""
+        assert finance_app.checkpointer is not None
@@ -4,6 +4,13 @@ Web UI for AI Finance Assistant.
 A Gradio-based chat interface with real-time streaming.
 """
 
-from .app import demo, get_app
-
 __all__ = ["demo", "get_app"]
+
+
+def __getattr__(name: str):
+    """Import the app module only when demo or get_app is first used (PEP 562)."""
+    if name in __all__:
+        from . import app
+
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
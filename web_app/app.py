@@ -10,65 +10,139 @@ Usage:
     uv run python web_app/app.py
 """
 
-import sys
-from pathlib import Path
+import secrets
+import threading
+import time
+from typing import Callable, Dict, Generator, Optional, Tuple
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-import gradio as gr
-import uuid
-from typing import Generator, Tuple
-
-# Import the LangGraph app
-from src.orchestration import create_app_with_memory
 
+# Minimum seconds between streamed progress updates (~30 updates per second)
+STREAM_MIN_INTERVAL = 1 / 30
 
 # Global app instance
 _app = None
+_app_lock = threading.Lock()
+
+# Gradio interface, built on first access to `demo`
+_demo = None
+
+# Example questions offered below the chat input
+_EXAMPLE_QUESTIONS = (
+    "How is my portfolio performing?",
+    "What is compound interest?",
+    "Should I invest in Tesla?",
+    "Help me plan for retirement",
+    "What's happening in the market today?",
+)
+
+# Startup banner printed when run as a script
+_BANNER = "\n".join([
+    "=" * 70,
+    "🚀 Starting AI Finance Assistant Web UI",
+    "=" * 70,
+    "",
+    "Features:",
+    "  ✅ Real-time execution progress",
+    "  ✅ Multi-agent routing (Fast Router + Supervisor)",
+    "  ✅ Conversation persistence",
+    "  ✅ Clean, modern interface",
+    "",
+    "=" * 70,
+    "",
+])
+
+
+def get_app(app=None):
+    """
+    Get or create the LangGraph app singleton (safe to call from several threads).
 
+    Args:
+        app: Optional prebuilt app to install as the singleton, e.g. a shared
+            test fixture. When omitted, the app is created on first use.
 
-def get_app():
-    """Get or create the LangGraph app singleton."""
+    Returns:
+        The LangGraph app used by the chat handler
+    """
     global _app
+    if app is not None:
+        with _app_lock:
+            _app = app
+        return app
     if _app is None:
-        _app = create_app_with_memory()
+        with _app_lock:
+            # Another thread may have built it while we waited for the lock
+            if _app is None:
+                # Imported here so importing this module does not load LangGraph
+                from src.orchestration import create_app_with_memory
+
+                _app = create_app_with_memory()
     return _app
 
 
+def _format_fast_router(state_update: dict) -> Optional[str]:
+    """Describe the fast router's decision."""
+    router_decision = state_update.get("router_decision")
+    if router_decision:
+        confidence = router_decision.confidence
+        if router_decision.route == "direct":
+            return f"🔍 Fast Router: Routing to **{router_decision.agent.value}** agent (confidence: {confidence:.2f})"
+        else:
+            return f"🔍 Fast Router: Using supervisor (low confidence: {confidence:.2f})"
+    return None
+
+
+def _format_supervisor(state_update: dict) -> Optional[str]:
+    """Describe the supervisor's agent selection."""
+    supervisor_decision = state_update.get("supervisor_decision")
+    if supervisor_decision:
+        primary = supervisor_decision.primary_agent.value
+        secondary_agents = supervisor_decision.secondary_agents
+        if secondary_agents:
+            secondary = [a.value for a in secondary_agents]
+            return f"🎯 Supervisor: **{primary}** + {secondary} ({supervisor_decision.execution_mode})"
+        else:
+            return f"🎯 Supervisor: **{primary}** agent"
+    return None
+
+
+# Statuses that do not depend on the state update
+_STATUS_SEQUENCE_ROUTER = "➡️  Routing to next agent..."
+_STATUS_SYNTHESIZER = "📋 Synthesizing results from multiple agents..."
+
+# Status formatters for nodes with fixed names; agent nodes are matched by suffix
+_STATUS_HANDLERS: Dict[str, Callable[[dict], Optional[str]]] = {
+    "fast_router": _format_fast_router,
+    "supervisor": _format_supervisor,
+    "sequence_router": lambda state_update: _STATUS_SEQUENCE_ROUTER,
+    "synthesizer": lambda state_update: _STATUS_SYNTHESIZER,
+}
+
+
 def format_status_update(node_name: str, state_update: dict) -> str:
     """Format execution progress for display."""
-    if node_name == "fast_router":
-        router_decision = state_update.get("router_decision")
-        if router_decision:
-            confidence = router_decision.confidence
-            if router_decision.route == "direct":
-                return f"🔍 Fast Router: Routing to **{router_decision.agent.value}** agent (confidence: {confidence:.2f})"
-            else:
-                return f"🔍 Fast Router: Using supervisor (low confidence: {confidence:.2f})"
-
-    elif node_name == "supervisor":
-        supervisor_decision = state_update.get("supervisor_decision")
-        if supervisor_decision:
-            primary = supervisor_decision.primary_agent.value
-            if supervisor_decision.secondary_agents:
-                secondary = [a.value for a in supervisor_decision.secondary_agents]
-                return f"🎯 Supervisor: **{primary}** + {secondary} ({supervisor_decision.execution_mode})"
-            else:
-                return f"🎯 Supervisor: **{primary}** agent"
+    handler = _STATUS_HANDLERS.get(node_name)
+    if handler is not None:
+        status = handler(state_update)
+        if status:
+            return status
 
     elif node_name.endswith("_agent"):
         agent_name = node_name.replace("_agent", "")
         return f"▶️  Executing **{agent_name}** agent..."
 
-    elif node_name == "sequence_router":
-        return "➡️  Routing to next agent..."
+    return f"⚙️  {node_name}"
 
-    elif node_name == "synthesizer":
-        return "📋 Synthesizing results from multiple agents..."
 
-    return f"⚙️  {node_name}"
+def _final_response_from(state_update: Optional[dict]) -> Optional[str]:
+    """Extract the answer from the terminal node's state update, if present."""
+    if not state_update:
+        return None
+    if state_update.get("final_response"):
+        return state_update["final_response"]
+    messages = state_update.get("messages") or []
+    if messages and getattr(messages[-1], "type", None) == "ai":
+        return messages[-1].content
+    return None
 
 
 def chat_with_assistant(
@@ -93,19 +167,19 @@ def chat_with_assistant(
         yield history
         return
 
-    # Add user message to history (Gradio 6.x messages format)
-    history = history + [{"role": "user", "content": message}]
-
-    # Add typing indicator in chat (so user sees bot is working)
-    typing_history = history + [{"role": "assistant", "content": "🤔 Thinking..."}]
-    yield typing_history
+    # Add user message and typing indicator to history (Gradio 6.x messages format).
+    # The history is copied once; later updates only change the assistant message.
+    assistant_msg = {"role": "assistant", "content": "🤔 Thinking..."}
+    history = history + [{"role": "user", "content": message}, assistant_msg]
+    yield history
 
     app = get_app()
     config = {"configurable": {"thread_id": thread_id}}
 
     try:
         # Stream the workflow execution
-        final_response = None
+        last_update = None
+        last_yield = 0.0
 
         # Send only the new message - LangGraph will merge with checkpointed history
         for chunk in app.stream(
@@ -120,33 +194,37 @@ def chat_with_assistant(
                 # Format status update
                 status = format_status_update(node_name, state_update)
 
-                # Check for final response
-                if "final_response" in state_update and state_update["final_response"]:
-                    final_response = state_update["final_response"]
+                # The last update comes from the terminal node (agent or synthesizer)
+                last_update = state_update
 
-                # Update typing indicator with current progress
-                typing_history = history + [{"role": "assistant", "content": f"⏳ {status}"}]
-                yield typing_history
+                # Update typing indicator with current progress, throttled so
+                # bursts of quick updates don't flood the client
+                assistant_msg["content"] = f"⏳ {status}"
+                now = time.monotonic()
+                if now - last_yield >= STREAM_MIN_INTERVAL:
+                    yield history
+                    last_yield = now
 
-        # Get final response if not found in stream
+        # Read the checkpoint only if the terminal update carried no answer
+        final_response = _final_response_from(last_update)
         if not final_response:
             final_state = app.get_state(config)
             final_response = final_state.values.get("final_response", "No response generated")
 
         # Replace typing indicator with actual response
-        history = history + [{"role": "assistant", "content": final_response}]
+        assistant_msg["content"] = final_response
         yield history
 
     except Exception as e:
         error_response = f"I apologize, but I encountered an error: {str(e)}\n\nPlease try again or rephrase your question."
         # Replace typing indicator with error response
-        history = history + [{"role": "assistant", "content": error_response}]
+        assistant_msg["content"] = error_response
         yield history
 
 
 def create_new_thread() -> str:
     """Create a new conversation thread ID."""
-    return f"session_{uuid.uuid4().hex[:8]}"
+    return f"session_{secrets.token_hex(4)}"
 
 
 def clear_chat() -> Tuple[list, str]:
@@ -155,121 +233,137 @@ def clear_chat() -> Tuple[list, str]:
     return [], new_thread
 
 
-# Create the Gradio interface
-with gr.Blocks(title="AI Finance Assistant") as demo:
-    # Header
-    gr.Markdown(
-        """
-        # 🤖 AI Finance Assistant
+def build_demo():
+    """
+    Build the Gradio interface.
 
-        Ask questions about **finance, investments, portfolio analysis, and financial planning**.
- 
-        """
-    )
+    Gradio is imported here rather than at module level, so importing this
+    module (e.g. for get_app) does not load it.
 
-    # Chat interface
-    chatbot = gr.Chatbot(
-        height=500,
-        show_label=False,
-    )
+    Returns:
+        The gr.Blocks demo, ready to launch
+    """
+    import gradio as gr
 
-    # Status display
-    # status_box = gr.Textbox(
-    #     label="Status",
-    #     value="Ready to answer your questions",
-    #     interactive=False,
-    #     show_label=True,
-    # )
-
-    # Input area
-    with gr.Row():
-        msg_input = gr.Textbox(
-            placeholder="Ask a question about finance, investments, or your portfolio...",
-            show_label=False,
-            scale=4,
+    with gr.Blocks(title="AI Finance Assistant") as demo:
+        # Header
+        gr.Markdown(
+            """
+            # 🤖 AI Finance Assistant
+
+            Ask questions about **finance, investments, portfolio analysis, and financial planning**.
+ 
+            """
         )
-        submit_btn = gr.Button("Send 📤", scale=1, variant="primary")
 
-    # Thread ID display (hidden state)
-    thread_id_state = gr.State(value=create_new_thread())
+        # Chat interface
+        chatbot = gr.Chatbot(
+            height=500,
+            show_label=False,
+        )
 
-    # Controls
-    with gr.Row():
-        clear_btn = gr.Button("🗑️ Clear Chat", size="sm")
-        # thread_display = gr.Textbox(
-        #     label="Thread ID",
+        # Status display
+        # status_box = gr.Textbox(
+        #     label="Status",
+        #     value="Ready to answer your questions",
         #     interactive=False,
-        #     scale=1,
+        #     show_label=True,
         # )
 
-    # Examples
-    gr.Examples(
-        examples=[
-            "How is my portfolio performing?",
-            "What is compound interest?",
-            "Should I invest in Tesla?",
-            "Help me plan for retirement",
-            "What's happening in the market today?",
-        ],
-        inputs=msg_input,
-        label="Example Questions",
-    )
+        # Input area
+        with gr.Row():
+            msg_input = gr.Textbox(
+                placeholder="Ask a question about finance, investments, or your portfolio...",
+                show_label=False,
+                scale=4,
+            )
+            submit_btn = gr.Button("Send 📤", scale=1, variant="primary")
+
+        # Thread ID display (hidden state)
+        thread_id_state = gr.State(value=create_new_thread())
+
+        # Controls
+        with gr.Row():
+            clear_btn = gr.Button("🗑️ Clear Chat", size="sm")
+            # thread_display = gr.Textbox(
+            #     label="Thread ID",
+            #     interactive=False,
+            #     scale=1,
+            # )
+
+        # Examples
+        gr.Examples(
+            examples=list(_EXAMPLE_QUESTIONS),
+            inputs=msg_input,
+            label="Example Questions",
+        )
 
-    # Event handlers
-    msg_input.submit(
-        chat_with_assistant,
-        inputs=[msg_input, chatbot, thread_id_state],
-        outputs=[chatbot],
-    ).then(
-        lambda: "",  # Clear input after submission
-        outputs=[msg_input],
-    )
+        # Event handlers
+        msg_input.submit(
+            chat_with_assistant,
+            inputs=[msg_input, chatbot, thread_id_state],
+            outputs=[chatbot],
+        ).then(
+            None,
+            outputs=[msg_input],
+            js="() => ''",  # Clear input after submission in the browser
+        )
 
-    submit_btn.click(
-        chat_with_assistant,
-        inputs=[msg_input, chatbot, thread_id_state],
-        outputs=[chatbot],
-    ).then(
-        lambda: "",  # Clear input after submission
-        outputs=[msg_input],
-    )
+        submit_btn.click(
+            chat_with_assistant,
+            inputs=[msg_input, chatbot, thread_id_state],
+            outputs=[chatbot],
+        ).then(
+            None,
+            outputs=[msg_input],
+            js="() => ''",  # Clear input after submission in the browser
+        )
 
-    clear_btn.click(
-        clear_chat,
-        outputs=[chatbot, thread_id_state],
-    )
+        clear_btn.click(
+            clear_chat,
+            outputs=[chatbot, thread_id_state],
+        )
+
+        # Update thread display when thread_id changes
+        # thread_id_state.change(
+        #     lambda x: x,
+        #     inputs=[thread_id_state],
+        #     outputs=[thread_display],
+        # )
+
+        # Initialize thread display
+        # demo.load(
+        #     lambda x: x,
+        #     inputs=[thread_id_state],
+        #     outputs=[thread_display],
+        # )
 
-    # Update thread display when thread_id changes
-    # thread_id_state.change(
-    #     lambda x: x,
-    #     inputs=[thread_id_state],
-    #     outputs=[thread_display],
-    # )
 
-    # Initialize thread display
-    # demo.load(
-    #     lambda x: x,
-    #     inputs=[thread_id_state],
-    #     outputs=[thread_display],
-    # )
+    return demo
+
+
+def __getattr__(name: str):
+    """Build `demo` lazily on first access (PEP 562)."""
+    global _demo
+    if name == "demo":
+        if _demo is None:
+            _demo = build_demo()
+        return _demo
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    print("=" * 70)
-    print("🚀 Starting AI Finance Assistant Web UI")
-    print("=" * 70)
-    print()
-    print("Features:")
-    print("  ✅ Real-time execution progress")
-    print("  ✅ Multi-agent routing (Fast Router + Supervisor)")
-    print("  ✅ Conversation persistence")
-    print("  ✅ Clean, modern interface")
-    print()
-    print("=" * 70)
-    print()
+    import os
+    import sys
+
+    # Add project root to Python path so `src` imports work from any directory
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, project_root)
+
+    print(_BANNER)
 
     # Launch the app
-    demo.launch(
+    build_demo().launch(
         server_name="0.0.0.0",  # Allow external access
         server_port=7860,
         share=False,  # Set to True to create public link
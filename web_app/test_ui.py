@@ -8,17 +8,31 @@ Usage:
     python web_app/test_ui.py
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
 
 import gradio as gr
 import time
 
 
+# Startup banner printed when run as a script
+_BANNER = "\n".join([
+    "=" * 70,
+    "🧪 AI Finance Assistant - UI Test",
+    "=" * 70,
+    "",
+    "This is a minimal test to verify Gradio is working.",
+    "The actual app is in web_app/app.py",
+    "",
+    "=" * 70,
+    "",
+])
+
+
 def mock_chat(message: str, history: list):
     """Mock chat function for testing UI."""
     # Add user message (Gradio 6.x messages format)
@@ -59,23 +73,15 @@ with gr.Blocks(title="AI Finance Assistant - Test UI") as demo:
 
     # Event handlers
     msg.submit(mock_chat, [msg, chatbot], [chatbot, status]).then(
-        lambda: "", outputs=[msg]
+        None, outputs=[msg], js="() => ''"
     )
     submit.click(mock_chat, [msg, chatbot], [chatbot, status]).then(
-        lambda: "", outputs=[msg]
+        None, outputs=[msg], js="() => ''"
     )
     clear.click(clear_chat, outputs=[chatbot, status])
 
 
 if __name__ == "__main__":
-    print("=" * 70)
-    print("🧪 AI Finance Assistant - UI Test")
-    print("=" * 70)
-    print()
-    print("This is a minimal test to verify Gradio is working.")
-    print("The actual app is in web_app/app.py")
-    print()
-    print("=" * 70)
-    print()
+    print(_BANNER)
 
     demo.launch(server_port=7860)